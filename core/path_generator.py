@@ -1,11 +1,12 @@
 import random
 from typing import List
 from enum import Enum
-from vmf.brushes import Solid
+from vmf.brushes import Solid, box_bounds
 from core.path_types import (
     PathPattern,
     PathSegment,
     SegmentDirection,
+    chain_segments,
     create_pattern
 )
 
@@ -44,6 +45,7 @@ class PathGenerator:
         self.segments: List[PathSegment] = []  # Path segments
         self.rotation_mode = RotationMode.NONE  # Rotation mode
         self.shape_manager = None  # Shape manager for block forms
+        self.used_random = False  # Last run fell back to a random retry
 
     def set_start_position(self, x: float, y: float, z: float):
         """Sets the start position."""
@@ -176,9 +178,8 @@ class PathGenerator:
         
         # Calculate AABB for new block (considering rotation)
         if rotation_z != 0:
-            # Create temporary solid to get rotated bounds
-            temp_solid = Solid(9999, pos, size, rotation_z)
-            min_x1, min_y1, max_x1, max_y1 = temp_solid.get_rotated_bounds()
+            # Rotated footprint only; no need to build a temporary Solid
+            min_x1, min_y1, max_x1, max_y1 = box_bounds(pos, size, rotation_z)
         else:
             min_x1, min_y1 = x1, y1
             max_x1, max_y1 = x1 + w1, y1 + l1
@@ -206,6 +207,7 @@ class PathGenerator:
 
     def generate_straight_line(self) -> List[Solid]:
         """Generates a straight line from blocks without collisions."""
+        self.used_random = False
         solids = []
         x, y, z = self.start_pos
         
@@ -255,6 +257,7 @@ class PathGenerator:
             
             while collision and attempts < max_attempts:
                 # Try different X position
+                self.used_random = True
                 x_range = (self.path_width - block_size[0]) / 2
                 block_x = x + random.uniform(-x_range, x_range)
                 block_x = self.snap_to_grid(block_x)
@@ -298,6 +301,7 @@ class PathGenerator:
 
     def generate_with_pattern(self) -> List[Solid]:
         """Generates blocks following a path pattern with corridors."""
+        self.used_random = False
         # If segments are not pre-set (custom chain), create them based on pattern
         if not self.segments:
             self.segments = create_pattern(
@@ -308,11 +312,7 @@ class PathGenerator:
             )
         
         # Calculate positions for all segments
-        current_pos = self.start_pos
-        for segment in self.segments:
-            segment.start_pos = current_pos
-            segment.calculate_end_pos()
-            current_pos = segment.end_pos
+        chain_segments(self.segments, self.start_pos)
         
         solids = []
         
@@ -418,6 +418,7 @@ class PathGenerator:
                 
                 while collision and attempts < max_attempts:
                     # Try different position on fixed axis
+                    self.used_random = True
                     half_width = segment.width / 2
                     center = segment.start_pos[fixed_axis]
                     offset_range = (segment.width - block_size[fixed_size_idx]) / 2
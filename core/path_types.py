@@ -91,6 +91,22 @@ class PathSegment:
         return False
 
 
+def chain_segments(segments: List[PathSegment],
+                   start_pos: Tuple[float, float, float]) -> None:
+    """
+    Lay segments end to end, starting at start_pos.
+    
+    Args:
+        segments: Segments to position (updated in place)
+        start_pos: Starting position (x, y, z) of the first segment
+    """
+    current_pos = start_pos
+    for segment in segments:
+        segment.start_pos = current_pos
+        segment.calculate_end_pos()
+        current_pos = segment.end_pos
+
+
 class PathPattern(Enum):
     """Predefined path patterns."""
     STRAIGHT = "straight"
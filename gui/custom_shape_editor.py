@@ -110,11 +110,10 @@ class ShapeCanvas(QWidget):
         
         # Draw shape outline if we have at least 3 vertices
         if len(self.vertices) >= 3:
-            polygon = QPolygonF()
-            for vx, vy in self.vertices:
-                center_x = (vx + 0.5) * cell_width
-                center_y = (vy + 0.5) * cell_height
-                polygon.append(QPointF(center_x, center_y))
+            polygon = QPolygonF([
+                QPointF((vx + 0.5) * cell_width, (vy + 0.5) * cell_height)
+                for vx, vy in self.vertices
+            ])
             
             painter.setPen(QPen(QColor(100, 255, 100), 3))
             painter.setBrush(QBrush(QColor(100, 255, 100, 30)))
@@ -198,6 +197,11 @@ class CustomShapeEditor(QDialog):
         
         self.setLayout(layout)
     
+    def reset(self):
+        """Clear the name and canvas so the dialog can be reused."""
+        self.name_input.clear()
+        self.canvas.clear()
+    
     def on_clear(self):
         """Clear the canvas."""
         self.canvas.clear()
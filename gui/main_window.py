@@ -1,3 +1,4 @@
+import copy
 import os
 from PySide6.QtWidgets import (
     QMainWindow,
@@ -9,12 +10,13 @@ from PySide6.QtWidgets import (
     QSpinBox,
     QDoubleSpinBox,
     QGroupBox,
-    QTextEdit,
+    QPlainTextEdit,
     QFileDialog,
     QComboBox,
     QCheckBox,
     QMessageBox,
 )
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
 from PySide6.QtGui import QFont
 
 from core.path_generator import PathGenerator, RotationMode
@@ -23,6 +25,56 @@ from vmf.writer import VMFWriter
 from gui.preview_widget import PreviewWidget
 
 
+class _WorkerSignals(QObject):
+    """Signals emitted by background workers."""
+
+    finished = Signal(object)
+    failed = Signal(str)
+
+
+class _SaveWorker(QRunnable):
+    """Writes the VMF file off the GUI thread."""
+
+    def __init__(self, writer: VMFWriter, filepath: str):
+        super().__init__()
+        self.writer = writer
+        self.filepath = filepath
+        self.signals = _WorkerSignals()
+
+    def run(self):
+        try:
+            self.writer.save(self.filepath)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(self.filepath)
+
+
+class _GenerateWorker(QRunnable):
+    """
+    Runs PathGenerator off the GUI thread.
+
+    Emits (solids, params, used_random) so the result carries the
+    parameters it was generated with and whether it drew random numbers.
+    """
+
+    def __init__(self, generator: PathGenerator, params: dict):
+        super().__init__()
+        self.generator = generator
+        self.params = params
+        self.signals = _WorkerSignals()
+
+    def run(self):
+        try:
+            solids = self.generator.generate_with_pattern()
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(
+                (solids, self.params, self.generator.used_random)
+            )
+
+
 class MainWindow(QMainWindow):
     """Main window."""
 
@@ -31,6 +83,10 @@ class MainWindow(QMainWindow):
         self.generator = PathGenerator()
         self.writer = VMFWriter()
         self.generated = False
+        self._save_worker = None
+        self._generate_worker = None
+        self._pending_generate_key = None
+        self._last_generate_key = None
         
         # Initialize shape manager
         from core.block_shapes import ShapeManager
@@ -74,7 +130,7 @@ class MainWindow(QMainWindow):
         self.start_x.setValue(0)
         self.start_x.setDecimals(0)
         self.start_x.setMaximumWidth(80)
-        self.start_x.valueChanged.connect(lambda: self._update_segment_zones_preview())
+        self.start_x.valueChanged.connect(self._on_zones_param_changed)
         pos_layout.addWidget(self.start_x)
         
         pos_layout.addWidget(QLabel("Y:"))
@@ -83,7 +139,7 @@ class MainWindow(QMainWindow):
         self.start_y.setValue(0)
         self.start_y.setDecimals(0)
         self.start_y.setMaximumWidth(80)
-        self.start_y.valueChanged.connect(lambda: self._update_segment_zones_preview())
+        self.start_y.valueChanged.connect(self._on_zones_param_changed)
         pos_layout.addWidget(self.start_y)
         
         pos_layout.addWidget(QLabel("Z:"))
@@ -92,7 +148,7 @@ class MainWindow(QMainWindow):
         self.start_z.setValue(0)
         self.start_z.setDecimals(0)
         self.start_z.setMaximumWidth(80)
-        self.start_z.valueChanged.connect(lambda: self._update_segment_zones_preview())
+        self.start_z.valueChanged.connect(self._on_zones_param_changed)
         pos_layout.addWidget(self.start_z)
 
         pos_layout.addStretch()
@@ -132,7 +188,7 @@ class MainWindow(QMainWindow):
         self.path_width.setValue(512)
         self.path_width.setDecimals(0)
         self.path_width.setSuffix(" units")
-        self.path_width.valueChanged.connect(lambda: self._update_segment_zones_preview())
+        self.path_width.valueChanged.connect(self._on_zones_param_changed)
         width_layout.addWidget(self.path_width)
         path_layout.addLayout(width_layout)
 
@@ -165,7 +221,7 @@ class MainWindow(QMainWindow):
             ["Straight", "Right Turn", "Left Turn", "S-Curve", "Zigzag"]
         )
         self.path_pattern.setCurrentText("Straight")
-        self.path_pattern.currentTextChanged.connect(lambda: self._update_segment_zones_preview())
+        self.path_pattern.currentTextChanged.connect(self._on_zones_param_changed)
         preset_layout.addWidget(self.path_pattern)
         self.preset_pattern_widget.setLayout(preset_layout)
         path_layout.addWidget(self.preset_pattern_widget)
@@ -178,7 +234,7 @@ class MainWindow(QMainWindow):
         custom_layout.addWidget(QLabel("Segment chain:"))
         
         # List of segments
-        self.segment_list = QTextEdit()
+        self.segment_list = QPlainTextEdit()
         self.segment_list.setReadOnly(True)
         self.segment_list.setMaximumHeight(100)
         self.segment_list.setPlaceholderText("No segments added. Click 'Add Segment' to start.")
@@ -210,7 +266,7 @@ class MainWindow(QMainWindow):
         self.segment_length.setValue(800)
         self.segment_length.setDecimals(0)
         self.segment_length.setSuffix(" units")
-        self.segment_length.valueChanged.connect(lambda: self._update_segment_zones_preview())
+        self.segment_length.valueChanged.connect(self._on_zones_param_changed)
         seg_length_layout.addWidget(self.segment_length)
         path_layout.addLayout(seg_length_layout)
 
@@ -223,9 +279,8 @@ class MainWindow(QMainWindow):
 
         grid_layout.addWidget(QLabel("Grid size (snap):"))
         self.grid_size = QComboBox()
-        self.grid_size.addItems(
-            ["1", "2", "4", "8", "16", "32", "64", "128", "256", "512"]
-        )
+        for value in (1, 2, 4, 8, 16, 32, 64, 128, 256, 512):
+            self.grid_size.addItem(str(value), value)
         self.grid_size.setCurrentText("32")
         grid_layout.addWidget(self.grid_size)
 
@@ -308,6 +363,9 @@ class MainWindow(QMainWindow):
         self.save_btn.setStyleSheet("QPushButton { font-size: 14px; padding: 10px; }")
         buttons_layout.addWidget(self.save_btn)
 
+        self.status_label = QLabel("")
+        buttons_layout.addWidget(self.status_label)
+
         layout.addLayout(buttons_layout)
         layout.addStretch()
 
@@ -319,19 +377,23 @@ class MainWindow(QMainWindow):
         panel = QGroupBox("Information & Preview")
         layout = QVBoxLayout()
 
+        # Shared font for section labels
+        self._bold_label_font = QFont("Arial", 10, QFont.Weight.Bold)
+
         # Log
         log_label = QLabel("Generation log:")
-        log_label.setFont(QFont("Arial", 10, QFont.Weight.Bold))
+        log_label.setFont(self._bold_label_font)
         layout.addWidget(log_label)
 
-        self.log_text = QTextEdit()
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
+        self.log_text.setMaximumBlockCount(500)  # Keep long sessions bounded
         self.log_text.setMaximumHeight(120)
         layout.addWidget(self.log_text)
 
         # 2D Preview widget
         preview_label = QLabel("2D Preview (Top View):")
-        preview_label.setFont(QFont("Arial", 10, QFont.Weight.Bold))
+        preview_label.setFont(self._bold_label_font)
         layout.addWidget(preview_label)
 
         self.preview_widget = PreviewWidget()
@@ -342,7 +404,7 @@ class MainWindow(QMainWindow):
 
     def log(self, message: str):
         """Adds a message to the log."""
-        self.log_text.append(message)
+        self.log_text.appendPlainText(message)
 
     def _on_randomize_toggled(self, checked: bool):
         """Handle randomize checkbox toggle."""
@@ -452,6 +514,10 @@ class MainWindow(QMainWindow):
         
         self.segment_list.setPlainText("\n".join(lines))
 
+    def _on_zones_param_changed(self, _value=None):
+        """Handle change of a parameter that affects segment zones."""
+        self._update_segment_zones_preview()
+
     def _on_show_zones_toggled(self, checked: bool):
         """Handle show zones checkbox toggle."""
         if checked:
@@ -460,19 +526,29 @@ class MainWindow(QMainWindow):
             # Clear zones from preview
             self.preview_widget.clear_segment_zones()
 
+    def _snapshot_params(self) -> dict:
+        """Reads the numeric generation parameters from the UI in one pass."""
+        return {
+            "start": (self.start_x.value(), self.start_y.value(), self.start_z.value()),
+            "block_count": self.block_count.value(),
+            "spacing": self.spacing.value(),
+            "path_width": self.path_width.value(),
+            "segment_length": self.segment_length.value(),
+            "max_blocks_per_row": self.max_blocks_per_row.value(),
+            "grid_size": self.grid_size.currentData(),
+        }
+
     def _update_segment_zones_preview(self):
         """Update segment zones preview based on current parameters."""
         if not self.show_zones_check.isChecked():
             return
 
         # Get current parameters
-        start_x = self.start_x.value()
-        start_y = self.start_y.value()
-        start_z = self.start_z.value()
-        path_width = self.path_width.value()
-        segment_length = self.segment_length.value()
+        params = self._snapshot_params()
+        path_width = params["path_width"]
+        segment_length = params["segment_length"]
         
-        from core.path_types import create_pattern, PathSegment
+        from core.path_types import create_pattern, chain_segments, PathSegment
         
         # Check mode
         if self.path_mode.currentText() == "Preset Pattern":
@@ -509,11 +585,7 @@ class MainWindow(QMainWindow):
                 segments.append(segment)
         
         # Calculate segment positions
-        current_pos = (start_x, start_y, start_z)
-        for segment in segments:
-            segment.start_pos = current_pos
-            segment.calculate_end_pos()
-            current_pos = segment.end_pos
+        chain_segments(segments, params["start"])
         
         # Update preview with segments
         self.preview_widget.update_segment_zones(segments)
@@ -524,18 +596,17 @@ class MainWindow(QMainWindow):
             self.log("=" * 50)
             self.log("Starting generation...")
 
-            # Get parameters from UI
-            start_x = self.start_x.value()
-            start_y = self.start_y.value()
-            start_z = self.start_z.value()
-            block_count = self.block_count.value()
-            spacing = self.spacing.value()
-            path_width = self.path_width.value()
-            max_blocks_per_row = self.max_blocks_per_row.value()
-            segment_length = self.segment_length.value()
+            # Get parameters from UI (read each widget once)
+            params = self._snapshot_params()
+            start_x, start_y, start_z = params["start"]
+            block_count = params["block_count"]
+            spacing = params["spacing"]
+            path_width = params["path_width"]
+            max_blocks_per_row = params["max_blocks_per_row"]
+            segment_length = params["segment_length"]
             randomize = self.randomize_check.isChecked()
             randomize_positions = self.randomize_positions_check.isChecked()
-            grid_size = int(self.grid_size.currentText())
+            grid_size = params["grid_size"]
             
             # Map UI pattern to enum
             pattern_map = {
@@ -592,7 +663,6 @@ class MainWindow(QMainWindow):
                 self.generator.segments = []
                 self.generator.set_path_pattern(selected_pattern)
                 self.log(f"Path pattern: {self.path_pattern.currentText()}")
-                solids = self.generator.generate_with_pattern()
             else:
                 # Use custom chain
                 if not self.custom_segments:
@@ -613,34 +683,133 @@ class MainWindow(QMainWindow):
                 # Set segments in generator
                 self.generator.segments = segments
                 self.log(f"Custom chain: {len(segments)} segments")
-                solids = self.generator.generate_with_pattern()
 
-            self.log(f"Generated {len(solids)} blocks!")
+            # Identical deterministic request - keep the current result
+            key = self._generate_key(
+                params, randomize, randomize_positions,
+                selected_pattern, selected_rotation
+            )
+            if key is not None and key == self._last_generate_key:
+                self.log("Parameters unchanged, keeping previous result.")
+                if self.show_zones_check.isChecked():
+                    self.show_zones_check.setChecked(False)
+                return
 
-            # Clear the writer and add new solids
-            self.writer.clear()
-            for solid in solids:
-                self.writer.add_solid(solid)
+            self._pending_generate_key = key
+            self._generate_async(params)
 
-            self.generated = True
-            self.save_btn.setEnabled(True)
+        except Exception as e:
+            self._on_generation_failed(str(e))
+
+    def _generate_key(
+        self, params: dict, randomize: bool, randomize_positions: bool,
+        selected_pattern: PathPattern, selected_rotation: RotationMode
+    ):
+        """
+        Build a cache key for the current generation request.
+        
+        Returns None when the output depends on random choices, since such
+        results are not a pure function of the parameters.
+        """
+        # Custom shapes can be re-added under the same name with new
+        # geometry, so key on everything that shapes the output
+        enabled_shapes = tuple(
+            (
+                s.name,
+                s.shape_type,
+                tuple(s.size_multiplier),
+                tuple(tuple(v) for v in s.vertices or ()),
+            )
+            for s in self.shape_manager.get_enabled_shapes()
+        )
+        if (
+            randomize
+            or randomize_positions
+            or selected_rotation != RotationMode.NONE
+            or params["max_blocks_per_row"] > 1
+            or len(enabled_shapes) > 1
+        ):
+            return None
+
+        return (
+            tuple(sorted(params.items())),
+            selected_pattern,
+            self.path_mode.currentText(),
+            self.block_type.currentText(),
+            enabled_shapes,
+            tuple(
+                (seg["direction"], seg["length"], seg["blocks"])
+                for seg in self.custom_segments
+            ),
+        )
 
-            # Turn off zone preview when generating actual blocks
-            if self.show_zones_check.isChecked():
-                self.show_zones_check.setChecked(False)
-            self.preview_widget.clear_segment_zones()
+    def _generate_async(self, params: dict):
+        """Runs the configured generator on the thread pool."""
+        self.generate_btn.setEnabled(False)
+        self.manage_shapes_btn.setEnabled(False)
+        self.status_label.setText("Generating...")
+
+        # The worker gets its own copy so the shapes and settings it reads
+        # cannot change underneath it
+        worker = _GenerateWorker(copy.deepcopy(self.generator), params)
+        worker.signals.finished.connect(self._on_generation_finished)
+        worker.signals.failed.connect(self._on_generation_failed)
+        self._generate_worker = worker
+        # The writer's solids are replaced when generation finishes
+        self._update_save_button()
+        QThreadPool.globalInstance().start(worker)
+
+    def _update_save_button(self):
+        """Enable saving only with a result and no generation or save running."""
+        self.save_btn.setEnabled(
+            self.generated
+            and self._generate_worker is None
+            and self._save_worker is None
+        )
 
-            # Update the 2D preview
-            self.preview_widget.update_preview(
-                solids, (start_x, start_y, start_z), grid_size
-            )
+    def _on_generation_finished(self, result: tuple):
+        """Handle generated blocks from the background worker."""
+        solids, params, used_random = result
+        self._generate_worker = None
+        # A collision retry makes the result random even for fixed inputs
+        self._last_generate_key = (
+            None if used_random else self._pending_generate_key
+        )
+        self.generate_btn.setEnabled(True)
+        self.manage_shapes_btn.setEnabled(True)
+        self.status_label.setText("")
 
-            self.log("Generation completed! You can save the file.")
-            self.log(f"Path length: ~{(block_count - 1) * spacing:.0f} units")
+        self.log(f"Generated {len(solids)} blocks!")
 
-        except Exception as e:
-            self.log(f"ERROR: {str(e)}")
-            QMessageBox.critical(self, "Error", f"Error during generation:\n{str(e)}")
+        # Clear the writer and add new solids
+        self.writer.clear()
+        self.writer.extend(solids)
+
+        self.generated = True
+        self._update_save_button()
+
+        # Turn off zone preview when generating actual blocks
+        if self.show_zones_check.isChecked():
+            self.show_zones_check.setChecked(False)
+        self.preview_widget.clear_segment_zones()
+
+        # Update the 2D preview
+        self.preview_widget.update_preview(
+            solids, params["start"], params["grid_size"]
+        )
+
+        self.log("Generation completed! You can save the file.")
+        self.log(f"Path length: ~{(params['block_count'] - 1) * params['spacing']:.0f} units")
+
+    def _on_generation_failed(self, message: str):
+        """Handle generation error."""
+        self._generate_worker = None
+        self.generate_btn.setEnabled(True)
+        self.manage_shapes_btn.setEnabled(True)
+        self._update_save_button()
+        self.status_label.setText("")
+        self.log(f"ERROR: {message}")
+        QMessageBox.critical(self, "Error", f"Error during generation:\n{message}")
 
     def on_save(self):
         """Handler of the save button."""
@@ -658,15 +827,31 @@ class MainWindow(QMainWindow):
             )
 
             if filepath:
-                # Save
-                self.writer.save(filepath)
-                self.log(f"File saved: {filepath}")
-                QMessageBox.information(
-                    self,
-                    "Success",
-                    f"VMF file successfully saved!\n\n{filepath}\n\nNow you can open it in Hammer Editor.",
-                )
+                # Save in background, keep the window responsive
+                worker = _SaveWorker(self.writer, filepath)
+                worker.signals.finished.connect(self._on_save_finished)
+                worker.signals.failed.connect(self._on_save_failed)
+                self._save_worker = worker
+                self._update_save_button()
+                QThreadPool.globalInstance().start(worker)
 
         except Exception as e:
-            self.log(f"ERROR saving: {str(e)}")
-            QMessageBox.critical(self, "Error", f"Error during saving:\n{str(e)}")
+            self._on_save_failed(str(e))
+
+    def _on_save_finished(self, filepath: str):
+        """Handle successful background save."""
+        self._save_worker = None
+        self._update_save_button()
+        self.log(f"File saved: {filepath}")
+        QMessageBox.information(
+            self,
+            "Success",
+            f"VMF file successfully saved!\n\n{filepath}\n\nNow you can open it in Hammer Editor.",
+        )
+
+    def _on_save_failed(self, message: str):
+        """Handle background save error."""
+        self._save_worker = None
+        self._update_save_button()
+        self.log(f"ERROR saving: {message}")
+        QMessageBox.critical(self, "Error", f"Error during saving:\n{message}")
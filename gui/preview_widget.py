@@ -1,43 +1,86 @@
 """Widget for 2D preview of generated blocks."""
 
 from typing import List, Optional
+import numpy as np
+from PySide6.QtCore import QTimer
 from PySide6.QtWidgets import QWidget, QVBoxLayout
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.colors import to_rgba
 from matplotlib.figure import Figure
 from matplotlib.patches import Rectangle
 from vmf.brushes import Solid
 from core.path_types import PathSegment, SegmentDirection
 
 
+# Block fill colors by size, pre-resolved to RGBA
+_SIZE_COLOR_LUT = {
+    size: to_rgba(color)
+    for size, color in {
+        (64, 64, 32): "#FF6B6B",
+        (96, 96, 32): "#4ECDC4",
+        (128, 128, 32): "#95E1D3",
+        (128, 256, 32): "#F38181",
+        (192, 128, 32): "#FFE66D",
+    }.items()
+}
+_DEFAULT_RGBA = to_rgba("#808080")
+
+
 class PreviewWidget(QWidget):
     """Widget for 2D preview of blocks (top view)."""
 
     def __init__(self):
         super().__init__()
-        self.figure = Figure(figsize=(6, 8), facecolor="black")
+        # No layout engine: the axes fill the figure at a fixed position
+        self.figure = Figure(figsize=(6, 8), facecolor="black", layout=None)
         self.canvas = FigureCanvas(self.figure)
         self.ax = None
 
+        # Fall back to full redraws on canvases that cannot blit
+        self._use_blit = self.canvas.supports_blit
+        self._redraw_hover = (
+            self._redraw_hover_blit if self._use_blit else self._redraw_hover_full
+        )
+
         # Data
         self.solids: List[Solid] = []
         self.grid_size = 32
         self.start_pos = (0, 0, 0)
 
+        # Block bounds as arrays (x, y, x + w, y + l) for vectorized hit tests
+        self._xs = np.empty(0)
+        self._ys = np.empty(0)
+        self._x2s = np.empty(0)
+        self._y2s = np.empty(0)
+
         # Interactive state
         self.pressed = False
         self.press_x = 0
         self.press_y = 0
+        self._pan_dirty = False  # Viewport moved by a drag; grid rebuilt on release
         self.hovered_solid: Optional[int] = None
 
         # Artists (for selective redraw)
         self.grid_lines = []
-        self.block_patches = []
+        self._grid_bounds = None  # (x_min, y_min, x_max, y_max) covered by grid
+        self.block_collection = None
         self.player_marker = None
         self.hover_patch = None
-        self.size_texts = []
+        self._text_w = None
+        self._text_l = None
+        self._last_hover_drawn: Optional[int] = None
+        self.placeholder_text = None
+        self._bg = None  # Cached background for blitting hover artists
         self.segment_zones: List[PathSegment] = []
         self.zone_patches = []
 
+        # Coalesces pan redraws to at most one per display frame (~60 Hz)
+        self._redraw_timer = QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.setInterval(16)
+        self._redraw_timer.timeout.connect(self.canvas.draw_idle)
+
         layout = QVBoxLayout()
         layout.addWidget(self.canvas)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -49,15 +92,17 @@ class PreviewWidget(QWidget):
         self.canvas.mpl_connect("motion_notify_event", self.on_motion)
         self.canvas.mpl_connect("scroll_event", self.on_scroll)
         self.canvas.mpl_connect("resize_event", self.on_resize)
+        if self._use_blit:
+            self.canvas.mpl_connect("draw_event", self.on_draw)
 
         self._init_plot()
 
     def _init_plot(self):
-        """Initialize empty plot."""
-        self.figure.clear()
-        self.ax = self.figure.add_subplot(111)
+        """Create the axes and its persistent artists (once)."""
+        self.ax = self.figure.add_axes((0, 0, 1, 1))
         self.ax.set_facecolor("black")
-        # Don't set aspect here - will set in update_preview with adjustable='datalim'
+        # Use aspect='equal' with adjustable='datalim' to fill entire axes
+        self.ax.set_aspect("equal", adjustable="datalim")
 
         # No labels, no title, no ticks
         self.ax.set_xticks([])
@@ -65,10 +110,8 @@ class PreviewWidget(QWidget):
         for spine in self.ax.spines.values():
             spine.set_visible(False)
 
-        self.figure.subplots_adjust(left=0, right=1, top=1, bottom=0)
-
         # Placeholder text
-        self.ax.text(
+        self.placeholder_text = self.ax.text(
             0.5,
             0.5,
             "Generate blocks to see preview",
@@ -80,137 +123,187 @@ class PreviewWidget(QWidget):
             style="italic",
         )
 
-        self.canvas.draw()
+        # All blocks share one collection, updated in place on regeneration
+        self.block_collection = PolyCollection(
+            [],
+            edgecolors="white",
+            linewidths=1,
+            alpha=0.6,
+            zorder=10,
+        )
+        self.ax.add_collection(self.block_collection, autolim=False)
+
+        # Start player marker, moved by _draw_player
+        self.player_marker, = self.ax.plot(
+            [],
+            [],
+            "g^",
+            markersize=10,
+            markeredgecolor="white",
+            markeredgewidth=1.5,
+            zorder=100,
+            scalex=False,
+            scaley=False,
+        )
+
+        # Hover highlight and labels (their bbox patches are built here once)
+        self._create_hover_artists()
+
+        self.canvas.draw_idle()
+
+    def _reset_plot(self):
+        """Return to the empty placeholder state."""
+        self.solids = []
+        self._xs = self._ys = self._x2s = self._y2s = np.empty(0)
+        self.hovered_solid = None
+        self._hide_hover_artists()
+        self._clear_grid()
+        self.block_collection.set_verts([])
+        self.player_marker.set_data([], [])
+        self.placeholder_text.set_visible(True)
+        self.canvas.draw_idle()
 
     def update_preview(
         self, solids: List[Solid], start_pos: tuple, grid_size: int = 32
     ):
         """Update preview with new blocks."""
         if not solids:
-            self._init_plot()
+            self._reset_plot()
             return
 
         self.solids = solids
         self.start_pos = start_pos
         self.grid_size = grid_size
 
-        self.figure.clear()
-        self.ax = self.figure.add_subplot(111)
-        self.ax.set_facecolor("black")
-        # Use aspect='equal' with adjustable='datalim' to fill entire axes
-        self.ax.set_aspect("equal", adjustable="datalim")
-
-        # Clean UI
-        self.ax.set_xticks([])
-        self.ax.set_yticks([])
-        for spine in self.ax.spines.values():
-            spine.set_visible(False)
+        self._xs = np.fromiter((s.pos[0] for s in solids), dtype=np.float64, count=len(solids))
+        self._ys = np.fromiter((s.pos[1] for s in solids), dtype=np.float64, count=len(solids))
+        self._x2s = self._xs + np.fromiter((s.size[0] for s in solids), dtype=np.float64, count=len(solids))
+        self._y2s = self._ys + np.fromiter((s.size[1] for s in solids), dtype=np.float64, count=len(solids))
 
-        self.figure.subplots_adjust(left=0, right=1, top=1, bottom=0)
+        # Hovered index refers to the previous block list
+        self.hovered_solid = None
+        self._hide_hover_artists()
+        self.placeholder_text.set_visible(False)
 
         # Calculate boundaries
-        all_x = [s.pos[0] for s in solids] + [s.pos[0] + s.size[0] for s in solids]
-        all_y = [s.pos[1] for s in solids] + [s.pos[1] + s.size[1] for s in solids]
         padding = max(200, grid_size * 5)
-        x_min, x_max = min(all_x) - padding, max(all_x) + padding
-        y_min, y_max = min(all_y) - padding, max(all_y) + padding
+        x_min = float(self._xs.min()) - padding
+        x_max = float(self._x2s.max()) + padding
+        y_min = float(self._ys.min()) - padding
+        y_max = float(self._y2s.max()) + padding
 
         self.ax.set_xlim(x_min, x_max)
         self.ax.set_ylim(y_min, y_max)
 
         # Draw everything
+        self._clear_grid()
         self._draw_grid_for_viewport()
         self._draw_blocks()
         self._draw_player()
 
-        self.canvas.draw()
+        self.canvas.draw_idle()
 
     def _draw_grid_for_viewport(self):
-        """Draw grid for current viewport + large margin."""
+        """Draw grid for current viewport + one viewport of margin."""
         x_min, x_max = self.ax.get_xlim()
         y_min, y_max = self.ax.get_ylim()
 
-        # Add MASSIVE margin to ensure grid covers everything during pan/zoom
-        margin = max(abs(x_max - x_min), abs(y_max - y_min)) * 10
-
-        x_start = int((x_min - margin) / self.grid_size) * self.grid_size
-        x_end = int((x_max + margin) / self.grid_size + 1) * self.grid_size
-        y_start = int((y_min - margin) / self.grid_size) * self.grid_size
-        y_end = int((y_max + margin) / self.grid_size + 1) * self.grid_size
-
-        self.grid_lines = []
+        # Margin lets short pans reuse the grid; _ensure_grid_covers_view
+        # rebuilds it once the viewport drifts close to the edge
+        margin = max(abs(x_max - x_min), abs(y_max - y_min))
+
+        # Grid line coordinates as integer multiples of the grid size
+        # (exact, and floor/ceil also snap outward for negative values)
+        xs = np.arange(
+            np.floor((x_min - margin) / self.grid_size),
+            np.ceil((x_max + margin) / self.grid_size) + 1,
+        ) * self.grid_size
+        ys = np.arange(
+            np.floor((y_min - margin) / self.grid_size),
+            np.ceil((y_max + margin) / self.grid_size) + 1,
+        ) * self.grid_size
+        x_start, x_end = xs[0], xs[-1]
+        y_start, y_end = ys[0], ys[-1]
+
+        # One segment per grid line: [[x0, y0], [x1, y1]]
+        vertical = np.empty((len(xs), 2, 2))
+        vertical[:, :, 0] = xs[:, None]
+        vertical[:, 0, 1] = y_start
+        vertical[:, 1, 1] = y_end
+
+        horizontal = np.empty((len(ys), 2, 2))
+        horizontal[:, 0, 0] = x_start
+        horizontal[:, 1, 0] = x_end
+        horizontal[:, :, 1] = ys[:, None]
+
+        grid = LineCollection(
+            np.concatenate([vertical, horizontal]),
+            colors="#707070",
+            linewidths=0.5,
+            alpha=0.8,
+            zorder=0,
+            rasterized=True,
+            antialiased=False,  # Thin axis-aligned lines look the same without AA
+        )
+        self.ax.add_collection(grid, autolim=False)
+        self.grid_lines = [grid]
+        self._grid_bounds = (float(x_start), float(y_start), float(x_end), float(y_end))
 
-        # Vertical lines
-        x = x_start
-        while x <= x_end:
-            line = self.ax.axvline(
-                x, color="#707070", linewidth=0.5, alpha=0.8, zorder=0
-            )
-            self.grid_lines.append(line)
-            x += self.grid_size
-
-        # Horizontal lines
-        y = y_start
-        while y <= y_end:
-            line = self.ax.axhline(
-                y, color="#707070", linewidth=0.5, alpha=0.8, zorder=0
-            )
-            self.grid_lines.append(line)
-            y += self.grid_size
+    def _ensure_grid_covers_view(self):
+        """Rebuild the grid if the viewport (plus half a viewport) leaves it."""
+        if self._grid_bounds is None:
+            return
+        x_min, x_max = self.ax.get_xlim()
+        y_min, y_max = self.ax.get_ylim()
+        half = max(x_max - x_min, y_max - y_min) / 2
+        gx_min, gy_min, gx_max, gy_max = self._grid_bounds
+        if (
+            x_min - half < gx_min
+            or x_max + half > gx_max
+            or y_min - half < gy_min
+            or y_max + half > gy_max
+        ):
+            self._clear_grid()
+            self._draw_grid_for_viewport()
 
     def _draw_blocks(self):
         """Draw blocks."""
-        size_colors = {
-            (64, 64, 32): "#FF6B6B",
-            (96, 96, 32): "#4ECDC4",
-            (128, 128, 32): "#95E1D3",
-            (128, 256, 32): "#F38181",
-            (192, 128, 32): "#FFE66D",
-        }
-
-        self.block_patches = []
-        for solid in self.solids:
-            x, y, z = solid.pos
-            w, l, h = solid.size
-            color = size_colors.get(solid.size, "#808080")
-
-            rect = Rectangle(
-                (x, y),
-                w,
-                l,
-                facecolor=color,
-                edgecolor="white",
-                linewidth=1,
-                alpha=0.6,
-                zorder=10,
-            )
-            
-            # Apply rotation if block is rotated
-            if hasattr(solid, 'rotation_z') and solid.rotation_z != 0:
-                import matplotlib.transforms as transforms
-                # Rotate around block center
-                center_x = x + w / 2
-                center_y = y + l / 2
-                t = transforms.Affine2D().rotate_deg_around(
-                    center_x, center_y, solid.rotation_z
-                ) + self.ax.transData
-                rect.set_transform(t)
-            
-            self.ax.add_patch(rect)
-            self.block_patches.append(rect)
+        colors = np.array(
+            [_SIZE_COLOR_LUT.get(solid.size, _DEFAULT_RGBA) for solid in self.solids],
+            dtype=np.float32,
+        )
+
+        # Rectangle corners (N, 4, 2), counter-clockwise from bottom-left
+        x1, y1, x2, y2 = self._xs, self._ys, self._x2s, self._y2s
+        verts = np.empty((len(x1), 4, 2))
+        verts[:, 0, 0] = x1
+        verts[:, 0, 1] = y1
+        verts[:, 1, 0] = x2
+        verts[:, 1, 1] = y1
+        verts[:, 2, 0] = x2
+        verts[:, 2, 1] = y2
+        verts[:, 3, 0] = x1
+        verts[:, 3, 1] = y2
+
+        # Apply rotation around each block center
+        angles = np.radians([solid.rotation_z for solid in self.solids])
+        if angles.any():
+            cx = ((x1 + x2) / 2)[:, None]
+            cy = ((y1 + y2) / 2)[:, None]
+            cos_a = np.cos(angles)[:, None]
+            sin_a = np.sin(angles)[:, None]
+            dx = verts[:, :, 0] - cx
+            dy = verts[:, :, 1] - cy
+            verts[:, :, 0] = cx + dx * cos_a - dy * sin_a
+            verts[:, :, 1] = cy + dx * sin_a + dy * cos_a
+
+        self.block_collection.set_verts(verts)
+        self.block_collection.set_facecolor(colors)
 
     def _draw_player(self):
         """Draw start player point."""
         player_x, player_y, _ = self.start_pos
-        self.player_marker = self.ax.plot(
-            player_x,
-            player_y,
-            "g^",
-            markersize=10,
-            markeredgecolor="white",
-            markeredgewidth=1.5,
-            zorder=100,
-        )[0]
+        self.player_marker.set_data([player_x], [player_y])
 
     def on_press(self, event):
         """Mouse press handler."""
@@ -224,6 +317,15 @@ class PreviewWidget(QWidget):
         """Mouse release handler."""
         self.pressed = False
 
+        # Recenter the grid on the final viewport once per drag
+        if self._pan_dirty:
+            self._pan_dirty = False
+            if self._grid_bounds is not None:
+                self._clear_grid()
+                self._draw_grid_for_viewport()
+            self._bg = None
+            self.canvas.draw_idle()
+
     def on_motion(self, event):
         """Mouse motion handler."""
         # Pan
@@ -237,8 +339,11 @@ class PreviewWidget(QWidget):
             self.ax.set_xlim(x_min - dx, x_max - dx)
             self.ax.set_ylim(y_min - dy, y_max - dy)
 
-            # Only redraw canvas, no grid regeneration
-            self.canvas.draw_idle()
+            # The grid margin covers the drag; rebuild it on release
+            self._pan_dirty = True
+
+            self._bg = None
+            self._request_redraw()
             return
 
         # Hover detection (only when not dragging)
@@ -248,25 +353,29 @@ class PreviewWidget(QWidget):
                 self._update_hover()
             return
 
-        hovered = None
-        for i, solid in enumerate(self.solids):
-            x, y, z = solid.pos
-            w, l, h = solid.size
-            if x <= event.xdata <= x + w and y <= event.ydata <= y + l:
-                hovered = i
-                break
+        x, y = event.xdata, event.ydata
+        mask = (self._xs <= x) & (x <= self._x2s) & (self._ys <= y) & (y <= self._y2s)
+        hovered = int(mask.argmax()) if mask.any() else None
 
         if hovered != self.hovered_solid:
             self.hovered_solid = hovered
             self._update_hover()
 
+    def _request_redraw(self):
+        """Schedule a coalesced redraw for the next frame."""
+        if not self._redraw_timer.isActive():
+            self._redraw_timer.start()
+
     def on_scroll(self, event):
         """Mouse scroll handler (zoom)."""
-        if not event.xdata or not event.ydata:
+        if event.xdata is None or event.ydata is None:
             return
 
-        # Zoom factor (smaller for smoother zoom)
-        scale_factor = 1.15 if event.button == "down" else 1 / 1.15
+        # Zoom factor per wheel notch (smaller for smoother zoom);
+        # fractional steps come from high-resolution wheels/touchpads
+        scale_factor = 1.15 ** -event.step
+        if abs(scale_factor - 1.0) < 1e-6:
+            return
 
         x_min, x_max = self.ax.get_xlim()
         y_min, y_max = self.ax.get_ylim()
@@ -288,91 +397,145 @@ class PreviewWidget(QWidget):
         new_y_min = y_data - new_height * y_ratio
         new_y_max = y_data + new_height * (1 - y_ratio)
 
-        self.ax.set_xlim(new_x_min, new_x_max)
-        self.ax.set_ylim(new_y_min, new_y_max)
+        self.ax.set(xlim=(new_x_min, new_x_max), ylim=(new_y_min, new_y_max))
+        self._ensure_grid_covers_view()
 
-        # Only redraw canvas
-        self.canvas.draw_idle()
+        self._bg = None
+        self._request_redraw()
 
     def on_resize(self, event):
         """Handle canvas resize - redraw grid to cover new viewport."""
         if not self.solids:
             return
 
-        # Remove old grid lines
-        for line in self.grid_lines:
-            line.remove()
-        self.grid_lines = []
-
         # Redraw grid for new viewport size
+        self._clear_grid()
         self._draw_grid_for_viewport()
 
         # Redraw canvas
+        self._bg = None
         self.canvas.draw_idle()
 
+    def _clear_grid(self):
+        """Remove grid lines from the axes."""
+        for line in self.grid_lines:
+            line.remove()
+        self.grid_lines = []
+        self._grid_bounds = None
+
+    def _create_hover_artists(self):
+        """Create the (initially hidden) hover highlight and size labels."""
+        # Highlight border
+        self.hover_patch = Rectangle(
+            (0, 0),
+            0,
+            0,
+            facecolor="none",
+            edgecolor="yellow",
+            linewidth=3,
+            zorder=50,
+            visible=False,
+            animated=self._use_blit,
+        )
+        self.ax.add_patch(self.hover_patch)
+
+        # Width label (bottom)
+        self._text_w = self.ax.text(
+            0,
+            0,
+            "",
+            ha="center",
+            va="top",
+            color="yellow",
+            fontsize=10,
+            fontweight="bold",
+            bbox=dict(boxstyle="round,pad=0.3", facecolor="black", alpha=0.8),
+            zorder=60,
+            visible=False,
+            animated=self._use_blit,
+        )
+
+        # Length label (left side)
+        self._text_l = self.ax.text(
+            0,
+            0,
+            "",
+            ha="right",
+            va="center",
+            color="yellow",
+            fontsize=10,
+            fontweight="bold",
+            bbox=dict(boxstyle="round,pad=0.3", facecolor="black", alpha=0.8),
+            zorder=60,
+            visible=False,
+            animated=self._use_blit,
+        )
+
+    def _hide_hover_artists(self):
+        """Hide hover highlight and size labels."""
+        self._last_hover_drawn = None
+        self.hover_patch.set_visible(False)
+        self._text_w.set_visible(False)
+        self._text_l.set_visible(False)
+
     def _update_hover(self):
         """Update hover display."""
-        # Remove old hover elements
-        if self.hover_patch:
-            self.hover_patch.remove()
-            self.hover_patch = None
-        for text in self.size_texts:
-            text.remove()
-        self.size_texts = []
-
-        # Add new hover elements
-        if self.hovered_solid is not None:
+        if self._last_hover_drawn == self.hovered_solid:
+            return
+
+        if self.hovered_solid is None:
+            self._hide_hover_artists()
+        else:
             solid = self.solids[self.hovered_solid]
             x, y, z = solid.pos
             w, l, h = solid.size
 
-            # Highlight border
-            self.hover_patch = Rectangle(
-                (x, y),
-                w,
-                l,
-                facecolor="none",
-                edgecolor="yellow",
-                linewidth=3,
-                zorder=50,
-            )
-            self.ax.add_patch(self.hover_patch)
-
-            # Width label (bottom)
-            text_w = self.ax.text(
-                x + w / 2,
-                y - 10,
-                f"{int(w)}",
-                ha="center",
-                va="top",
-                color="yellow",
-                fontsize=10,
-                fontweight="bold",
-                bbox=dict(boxstyle="round,pad=0.3", facecolor="black", alpha=0.8),
-                zorder=60,
-            )
-            self.size_texts.append(text_w)
-
-            # Length label (left side)
-            text_l = self.ax.text(
-                x - 10,
-                y + l / 2,
-                f"{int(l)}",
-                ha="right",
-                va="center",
-                color="yellow",
-                fontsize=10,
-                fontweight="bold",
-                bbox=dict(boxstyle="round,pad=0.3", facecolor="black", alpha=0.8),
-                zorder=60,
-            )
-            self.size_texts.append(text_l)
+            self.hover_patch.set_xy((x, y))
+            self.hover_patch.set_width(w)
+            self.hover_patch.set_height(l)
+            self.hover_patch.set_visible(True)
+
+            self._text_w.set_position((x + w / 2, y - 10))
+            self._text_w.set_text(f"{int(w)}")
+            self._text_w.set_visible(True)
+
+            self._text_l.set_position((x - 10, y + l / 2))
+            self._text_l.set_text(f"{int(l)}")
+            self._text_l.set_visible(True)
+
+        self._redraw_hover()
+        self._last_hover_drawn = self.hovered_solid
 
+    def on_draw(self, event):
+        """Capture the static background after every full redraw."""
+        if self.ax is None:
+            return
+        self._bg = self.canvas.copy_from_bbox(self.ax.bbox)
+        self._draw_hover_artists()
+
+    def _draw_hover_artists(self):
+        """Draw animated hover artists on top of the current canvas."""
+        self.ax.draw_artist(self.hover_patch)
+        self.ax.draw_artist(self._text_w)
+        self.ax.draw_artist(self._text_l)
+
+    def _redraw_hover_blit(self):
+        """Redraw only the hover artists over the cached background."""
+        if self._bg is None:
+            # Background is stale (pan/zoom/resize) - full redraw recaptures it
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._bg)
+        self._draw_hover_artists()
+        self.canvas.blit(self.ax.bbox)
+
+    def _redraw_hover_full(self):
+        """Redraw hover artists with a full canvas redraw (no blitting)."""
         self.canvas.draw_idle()
 
     def clear_preview(self):
         """Clear preview."""
-        self._init_plot()
+        self._reset_plot()
 
     def update_segment_zones(self, segments: List[PathSegment]):
         """Update preview with segment zones."""
@@ -384,8 +547,7 @@ class PreviewWidget(QWidget):
         
         # Clear old zone patches
         for patch in self.zone_patches:
-            if patch in self.ax.patches if self.ax else []:
-                patch.remove()
+            patch.remove()
         self.zone_patches = []
         
         # If we have blocks already, just draw zones on top
@@ -395,12 +557,7 @@ class PreviewWidget(QWidget):
             return
         
         # If no blocks, show zones in empty preview
-        # Initialize plot if needed
-        if self.ax is None:
-            self._init_plot()
-        
-        # Remove placeholder text if exists
-        self.ax.texts = []
+        self.placeholder_text.set_visible(False)
         
         # Calculate bounds for all segments
         all_x = []
@@ -420,10 +577,7 @@ class PreviewWidget(QWidget):
         self.ax.set_ylim(y_min, y_max)
         
         # Clear old grid
-        for line in self.grid_lines:
-            if line in self.ax.lines:
-                line.remove()
-        self.grid_lines = []
+        self._clear_grid()
         
         # Draw grid
         self.grid_size = 32  # default
@@ -432,7 +586,7 @@ class PreviewWidget(QWidget):
         # Draw segment zones
         self._draw_segment_zones()
         
-        self.canvas.draw()
+        self.canvas.draw_idle()
 
     def _draw_segment_zones(self):
         """Draw segment zone rectangles."""
@@ -485,13 +639,12 @@ class PreviewWidget(QWidget):
     def clear_segment_zones(self):
         """Clear segment zones from preview."""
         for patch in self.zone_patches:
-            if self.ax and patch in self.ax.patches:
-                patch.remove()
+            patch.remove()
         self.zone_patches = []
         self.segment_zones = []
         
         # If no blocks, restore placeholder
-        if not self.solids and self.ax:
-            self._init_plot()
-        elif self.ax:
+        if not self.solids:
+            self._reset_plot()
+        else:
             self.canvas.draw_idle()
@@ -3,10 +3,142 @@ from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QMessageBox,
     QWidget, QGridLayout, QScrollArea, QMenu
 )
-from PySide6.QtCore import Qt, QSize, QPropertyAnimation, QEasingCurve, Property
+from PySide6.QtCore import Qt, QSize, QLineF, QPointF, QTimer
 from PySide6.QtGui import QFont, QColor, QPixmap, QPainter, QPen, QBrush, QPolygonF, QMouseEvent, QAction
 from core.block_shapes import ShapeManager, ShapeType, SHAPE_DISPLAY_NAMES
-import math
+from gui.custom_shape_editor import CustomShapeEditor
+import time
+from functools import partial
+import numpy as np
+import shiboken6
+
+
+# Unit-circle (cos, sin) rows for regular polygons, starting from the top
+_REGULAR_POLY_TRIG = {
+    sides: np.column_stack([
+        np.cos(np.radians(np.arange(sides) * 360 / sides - 90)),
+        np.sin(np.radians(np.arange(sides) * 360 / sides - 90)),
+    ])
+    for sides in (5, 6, 8)
+}
+
+
+def _polygon_from_points(points: np.ndarray) -> QPolygonF:
+    """Build a QPolygonF from an (N, 2) array of x/y coordinates."""
+    # PySide6 has no buffer-protocol constructor; tolist() converts the
+    # whole array in one C call instead of indexing NumPy scalars per point
+    return QPolygonF([QPointF(x, y) for x, y in points.tolist()])
+
+
+def _draw_rect(painter, cx, cy, w, h):
+    painter.drawRect(int(cx - w / 2), int(cy - h / 2), int(w), int(h))
+
+
+def _draw_ellipse(painter, cx, cy, w, h):
+    painter.drawEllipse(int(cx - w / 2), int(cy - h / 2), int(w), int(h))
+
+
+def _draw_triangle(painter, cx, cy, w, h):
+    painter.drawPolygon(QPolygonF([
+        QPointF(cx, cy - h / 2),
+        QPointF(cx - w / 2, cy + h / 2),
+        QPointF(cx + w / 2, cy + h / 2),
+    ]))
+
+
+def _draw_rhombus(painter, cx, cy, w, h):
+    painter.drawPolygon(QPolygonF([
+        QPointF(cx, cy - h / 2),
+        QPointF(cx + w / 2, cy),
+        QPointF(cx, cy + h / 2),
+        QPointF(cx - w / 2, cy),
+    ]))
+
+
+def _draw_parallelogram(painter, cx, cy, w, h):
+    offset = w * 0.2
+    painter.drawPolygon(QPolygonF([
+        QPointF(cx - w / 2 + offset, cy - h / 2),
+        QPointF(cx + w / 2 + offset, cy - h / 2),
+        QPointF(cx + w / 2 - offset, cy + h / 2),
+        QPointF(cx - w / 2 - offset, cy + h / 2),
+    ]))
+
+
+def _draw_trapezoid(painter, cx, cy, w, h):
+    top_width = w * 0.6
+    painter.drawPolygon(QPolygonF([
+        QPointF(cx - top_width / 2, cy - h / 2),
+        QPointF(cx + top_width / 2, cy - h / 2),
+        QPointF(cx + w / 2, cy + h / 2),
+        QPointF(cx - w / 2, cy + h / 2),
+    ]))
+
+
+def _draw_regular_polygon(painter, cx, cy, w, h, sides):
+    radius = min(w, h) / 2
+    painter.drawPolygon(_polygon_from_points(_REGULAR_POLY_TRIG[sides] * radius + (cx, cy)))
+
+
+# Predefined shape type -> drawing function (cx, cy = center; w, h = size)
+_DRAW_DISPATCH = {
+    ShapeType.SQUARE: _draw_rect,
+    ShapeType.RECTANGLE: _draw_rect,
+    ShapeType.TRIANGLE: _draw_triangle,
+    ShapeType.CIRCLE: _draw_ellipse,
+    ShapeType.OVAL: _draw_ellipse,
+    ShapeType.ELLIPSE: _draw_ellipse,
+    ShapeType.RHOMBUS: _draw_rhombus,
+    ShapeType.PARALLELOGRAM: _draw_parallelogram,
+    ShapeType.TRAPEZOID: _draw_trapezoid,
+    ShapeType.PENTAGON: partial(_draw_regular_polygon, sides=5),
+    ShapeType.HEXAGON: partial(_draw_regular_polygon, sides=6),
+    ShapeType.OCTAGON: partial(_draw_regular_polygon, sides=8),
+}
+
+
+class _BorderAnimationDriver:
+    """Animates ShapeWidget border opacity for all widgets from one shared timer."""
+    
+    DURATION = 0.2  # seconds
+    
+    def __init__(self):
+        self._timer = None  # Created on first use (needs a QApplication)
+        self._active = {}  # widget -> (start_value, end_value, start_time)
+    
+    def start(self, widget, end_value: float):
+        """Animate widget's border opacity from its current value to end_value."""
+        self._active[widget] = (widget._border_opacity, end_value, time.monotonic())
+        if self._timer is None:
+            self._timer = QTimer()
+            self._timer.setInterval(16)  # ~60 Hz
+            self._timer.timeout.connect(self._tick)
+        if not self._timer.isActive():
+            self._timer.start()
+    
+    def _tick(self):
+        """Advance every active animation by one frame."""
+        now = time.monotonic()
+        for widget, (start, end, t0) in list(self._active.items()):
+            # Widgets can be deleted mid-animation (e.g. on reload)
+            if not shiboken6.isValid(widget):
+                del self._active[widget]
+                continue
+            
+            t = min((now - t0) / self.DURATION, 1.0)
+            # InOutQuad easing
+            eased = 2 * t * t if t < 0.5 else 1 - (-2 * t + 2) ** 2 / 2
+            # Always repaint the final frame so the end state is exact
+            widget.set_border_opacity(start + (end - start) * eased, force=t >= 1.0)
+            
+            if t >= 1.0:
+                del self._active[widget]
+        
+        if not self._active:
+            self._timer.stop()
+
+
+_border_animations = _BorderAnimationDriver()
 
 
 class ShapeWidget(QWidget):
@@ -19,6 +151,15 @@ class ShapeWidget(QWidget):
         self.parent_dialog = parent_dialog
         self.is_hovered = False
         self._border_opacity = 1.0 if shape.enabled else 0.0
+        self._painted_opacity = self._border_opacity  # Opacity of the last paint
+        self._static_pixmap = None  # Cached background + grid
+        self._border_pen = QPen(QColor(100, 255, 100), 3)
+        self._fill_brush = QBrush(QColor(100, 255, 100, 0))
+        
+        # Normalized (0-1) custom outline as an (N, 2) array, scaled per paint
+        self._custom_points = None
+        if shape.shape_type == ShapeType.CUSTOM and shape.vertices and len(shape.vertices) >= 3:
+            self._custom_points = np.asarray(shape.vertices, dtype=np.float64)
         
         self.setFixedSize(160, 160)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -27,20 +168,12 @@ class ShapeWidget(QWidget):
         if shape.shape_type == ShapeType.CUSTOM:
             self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
             self.customContextMenuRequested.connect(self._show_context_menu)
-        
-        # Animation for border
-        self.anim = QPropertyAnimation(self, b"border_opacity")
-        self.anim.setDuration(200)
-        self.anim.setEasingCurve(QEasingCurve.Type.InOutQuad)
     
-    def get_border_opacity(self):
-        return self._border_opacity
-    
-    def set_border_opacity(self, value):
+    def set_border_opacity(self, value, force=False):
         self._border_opacity = value
-        self.update()
-    
-    border_opacity = Property(float, get_border_opacity, set_border_opacity)
+        # Skip repaints for changes too small to see (tail of the easing curve)
+        if force or abs(value - self._painted_opacity) >= 0.01:
+            self.update()
     
     def mousePressEvent(self, event: QMouseEvent):
         """Toggle shape on click."""
@@ -48,29 +181,20 @@ class ShapeWidget(QWidget):
             self.shape.enabled = not self.shape.enabled
             
             # Animate to new state
-            self.anim.stop()
-            self.anim.setStartValue(self._border_opacity)
-            self.anim.setEndValue(1.0 if self.shape.enabled else 0.0)
-            self.anim.start()
+            _border_animations.start(self, 1.0 if self.shape.enabled else 0.0)
     
     def enterEvent(self, event):
         """Mouse enter - show light border."""
         self.is_hovered = True
         if not self.shape.enabled:
-            self.anim.stop()
-            self.anim.setStartValue(self._border_opacity)
-            self.anim.setEndValue(0.3)
-            self.anim.start()
+            _border_animations.start(self, 0.3)
         self.update()
     
     def leaveEvent(self, event):
         """Mouse leave - hide border if not enabled."""
         self.is_hovered = False
         if not self.shape.enabled:
-            self.anim.stop()
-            self.anim.setStartValue(self._border_opacity)
-            self.anim.setEndValue(0.0)
-            self.anim.start()
+            _border_animations.start(self, 0.0)
         self.update()
     
     def _show_context_menu(self, pos):
@@ -87,10 +211,20 @@ class ShapeWidget(QWidget):
         """Handle delete request."""
         self.parent_dialog.on_delete_shape(self.shape.name)
     
-    def paintEvent(self, event):
-        """Paint the shape icon."""
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    def resizeEvent(self, event):
+        """Drop the cached background when the widget size changes."""
+        self._static_pixmap = None
+        super().resizeEvent(event)
+    
+    def _render_static(self) -> QPixmap:
+        """Render the state-independent background and grid into a pixmap."""
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(self.size() * dpr)
+        pixmap.setDevicePixelRatio(dpr)
+        
+        # No antialiasing: the grid is axis-aligned 1px lines (the shape
+        # itself is still antialiased in paintEvent)
+        painter = QPainter(pixmap)
         
         size = min(self.width(), self.height())
         
@@ -100,26 +234,50 @@ class ShapeWidget(QWidget):
         # Draw grid
         grid_cells = 8
         cell_size = size / grid_cells
+        offsets = [int(i * cell_size) for i in range(grid_cells + 1)]
         painter.setPen(QPen(QColor(50, 50, 50), 1))
-        for i in range(grid_cells + 1):
-            painter.drawLine(int(i * cell_size), 0, int(i * cell_size), size)
-            painter.drawLine(0, int(i * cell_size), size, int(i * cell_size))
+        painter.drawLines(
+            [QLineF(o, 0, o, size) for o in offsets]
+            + [QLineF(0, o, size, o) for o in offsets]
+        )
+        
+        painter.end()
+        return pixmap
+    
+    def paintEvent(self, event):
+        """Paint the shape icon."""
+        if self._static_pixmap is None:
+            self._static_pixmap = self._render_static()
+        
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._static_pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        size = min(self.width(), self.height())
         
         # Calculate shape dimensions
         margin = size * 0.15
-        max_mult = max(self.shape.size_multiplier)
-        shape_width = (size - 2 * margin) * self.shape.size_multiplier[0] / max_mult
-        shape_height = (size - 2 * margin) * self.shape.size_multiplier[1] / max_mult
+        size_multiplier = self.shape.size_multiplier
+        max_mult = max(size_multiplier)
+        shape_width = (size - 2 * margin) * size_multiplier[0] / max_mult
+        shape_height = (size - 2 * margin) * size_multiplier[1] / max_mult
         
         center_x = size / 2
         center_y = size / 2
         
-        # Set pen/brush based on state
-        border_color = QColor(100, 255, 100)
+        self._painted_opacity = self._border_opacity
+        
+        # Set pen/brush based on state (only the alpha changes)
+        border_color = self._border_pen.color()
         border_color.setAlphaF(self._border_opacity)
+        self._border_pen.setColor(border_color)
+        
+        fill_color = self._fill_brush.color()
+        fill_color.setAlpha(int(40 * self._border_opacity))
+        self._fill_brush.setColor(fill_color)
         
-        painter.setPen(QPen(border_color, 3))
-        painter.setBrush(QBrush(QColor(100, 255, 100, int(40 * self._border_opacity))))
+        painter.setPen(self._border_pen)
+        painter.setBrush(self._fill_brush)
         
         # Draw shape based on type
         self._draw_shape_geometry(painter, center_x, center_y, shape_width, shape_height)
@@ -128,104 +286,17 @@ class ShapeWidget(QWidget):
     
     def _draw_shape_geometry(self, painter, cx, cy, w, h):
         """Draw the actual shape geometry."""
-        from PySide6.QtCore import QPointF
-        
-        if self.shape.shape_type == ShapeType.SQUARE or self.shape.shape_type == ShapeType.RECTANGLE:
-            x = cx - w / 2
-            y = cy - h / 2
-            painter.drawRect(int(x), int(y), int(w), int(h))
-        
-        elif self.shape.shape_type == ShapeType.TRIANGLE:
-            polygon = QPolygonF([
-                QPointF(cx, cy - h / 2),
-                QPointF(cx - w / 2, cy + h / 2),
-                QPointF(cx + w / 2, cy + h / 2),
-            ])
-            painter.drawPolygon(polygon)
-        
-        elif self.shape.shape_type == ShapeType.CIRCLE or self.shape.shape_type == ShapeType.OVAL:
-            x = cx - w / 2
-            y = cy - h / 2
-            painter.drawEllipse(int(x), int(y), int(w), int(h))
-        
-        elif self.shape.shape_type == ShapeType.ELLIPSE:
-            x = cx - w / 2
-            y = cy - h / 2
-            painter.drawEllipse(int(x), int(y), int(w), int(h))
-        
-        elif self.shape.shape_type == ShapeType.RHOMBUS:
-            polygon = QPolygonF([
-                QPointF(cx, cy - h / 2),
-                QPointF(cx + w / 2, cy),
-                QPointF(cx, cy + h / 2),
-                QPointF(cx - w / 2, cy),
-            ])
-            painter.drawPolygon(polygon)
-        
-        elif self.shape.shape_type == ShapeType.PARALLELOGRAM:
-            offset = w * 0.2
-            polygon = QPolygonF([
-                QPointF(cx - w / 2 + offset, cy - h / 2),
-                QPointF(cx + w / 2 + offset, cy - h / 2),
-                QPointF(cx + w / 2 - offset, cy + h / 2),
-                QPointF(cx - w / 2 - offset, cy + h / 2),
-            ])
-            painter.drawPolygon(polygon)
-        
-        elif self.shape.shape_type == ShapeType.TRAPEZOID:
-            top_width = w * 0.6
-            polygon = QPolygonF([
-                QPointF(cx - top_width / 2, cy - h / 2),
-                QPointF(cx + top_width / 2, cy - h / 2),
-                QPointF(cx + w / 2, cy + h / 2),
-                QPointF(cx - w / 2, cy + h / 2),
-            ])
-            painter.drawPolygon(polygon)
-        
-        elif self.shape.shape_type == ShapeType.PENTAGON:
-            polygon = QPolygonF()
-            radius = min(w, h) / 2
-            for i in range(5):
-                angle = math.radians(i * 72 - 90)
-                px = cx + radius * math.cos(angle)
-                py = cy + radius * math.sin(angle)
-                polygon.append(QPointF(px, py))
-            painter.drawPolygon(polygon)
-        
-        elif self.shape.shape_type == ShapeType.HEXAGON:
-            polygon = QPolygonF()
-            radius = min(w, h) / 2
-            for i in range(6):
-                angle = math.radians(i * 60 - 90)
-                px = cx + radius * math.cos(angle)
-                py = cy + radius * math.sin(angle)
-                polygon.append(QPointF(px, py))
-            painter.drawPolygon(polygon)
-        
-        elif self.shape.shape_type == ShapeType.OCTAGON:
-            polygon = QPolygonF()
-            radius = min(w, h) / 2
-            for i in range(8):
-                angle = math.radians(i * 45 - 90)
-                px = cx + radius * math.cos(angle)
-                py = cy + radius * math.sin(angle)
-                polygon.append(QPointF(px, py))
-            painter.drawPolygon(polygon)
-        
-        elif self.shape.shape_type == ShapeType.CUSTOM:
-            if self.shape.vertices and len(self.shape.vertices) >= 3:
+        shape = self.shape
+        if shape.shape_type == ShapeType.CUSTOM:
+            if self._custom_points is not None:
                 canvas_size = min(w, h) * 2
                 margin_custom = (self.width() - canvas_size) / 2
-                polygon = QPolygonF()
-                for vx, vy in self.shape.vertices:
-                    px = margin_custom + vx * canvas_size
-                    py = margin_custom + vy * canvas_size
-                    polygon.append(QPointF(px, py))
-                painter.drawPolygon(polygon)
+                painter.drawPolygon(_polygon_from_points(self._custom_points * canvas_size + margin_custom))
             else:
-                x = cx - w / 2
-                y = cy - h / 2
-                painter.drawRect(int(x), int(y), int(w), int(h))
+                _draw_rect(painter, cx, cy, w, h)
+            return
+        
+        _DRAW_DISPATCH.get(shape.shape_type, _draw_rect)(painter, cx, cy, w, h)
 
 
 class ShapeManagerDialog(QDialog):
@@ -238,6 +309,8 @@ class ShapeManagerDialog(QDialog):
         self.setMinimumSize(800, 700)
         
         self.shape_widgets = []
+        self._widgets_by_name = {}  # shape name -> ShapeWidget, reused across reloads
+        self._editor = None  # CustomShapeEditor, created on first use and reused
         
         self.init_ui()
         self.load_shapes()
@@ -297,20 +370,42 @@ class ShapeManagerDialog(QDialog):
     
     def load_shapes(self):
         """Load shapes into grid."""
-        # Clear existing widgets
-        for widget in self.shape_widgets:
-            widget.deleteLater()
-        self.shape_widgets = []
+        # Rebuild without intermediate repaints; one layout pass at the end
+        self.shapes_container.setUpdatesEnabled(False)
+        
+        # Reuse widgets of shapes that are still present; only the
+        # added/removed shapes create or delete a widget
+        old_widgets = self._widgets_by_name
+        self._widgets_by_name = {}
         
         # Add shapes to grid (4 columns)
         columns = 4
+        grid = self.shapes_grid
+        widgets = []
         for idx, shape in enumerate(self.shape_manager.shapes):
             row = idx // columns
             col = idx % columns
             
-            shape_widget = ShapeWidget(shape, self.shape_manager, self, self)
-            self.shapes_grid.addWidget(shape_widget, row, col)
-            self.shape_widgets.append(shape_widget)
+            shape_widget = old_widgets.pop(shape.name, None)
+            if shape_widget is not None and shape_widget.shape is shape:
+                # Survivor: move it to its (possibly new) cell
+                grid.removeWidget(shape_widget)
+            else:
+                if shape_widget is not None:
+                    shape_widget.deleteLater()
+                shape_widget = ShapeWidget(shape, self.shape_manager, self, self)
+            grid.addWidget(shape_widget, row, col)
+            widgets.append(shape_widget)
+            self._widgets_by_name[shape.name] = shape_widget
+        self.shape_widgets = widgets
+        
+        # Widgets of removed shapes
+        for widget in old_widgets.values():
+            grid.removeWidget(widget)
+            widget.deleteLater()
+        
+        grid.invalidate()
+        self.shapes_container.setUpdatesEnabled(True)
     
     def on_delete_shape(self, shape_name: str):
         """Delete a custom shape."""
@@ -325,162 +420,6 @@ class ShapeManagerDialog(QDialog):
             self.shape_manager.remove_custom_shape(shape_name)
             self.load_shapes()
     
-    def _create_shape_icon_old(self, shape) -> QLabel:
-        """Create a visual icon for the shape."""
-        import math
-        from PySide6.QtCore import QPointF
-        
-        label = QLabel()
-        
-        # Create pixmap
-        size = 200
-        pixmap = QPixmap(size, size)
-        pixmap.fill(QColor(30, 30, 30))
-        
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Draw grid
-        grid_cells = 8
-        cell_size = size / grid_cells
-        painter.setPen(QPen(QColor(50, 50, 50), 1))
-        for i in range(grid_cells + 1):
-            painter.drawLine(int(i * cell_size), 0, int(i * cell_size), size)
-            painter.drawLine(0, int(i * cell_size), size, int(i * cell_size))
-        
-        # Calculate shape dimensions
-        margin = size * 0.2
-        max_mult = max(shape.size_multiplier)
-        shape_width = (size - 2 * margin) * shape.size_multiplier[0] / max_mult
-        shape_height = (size - 2 * margin) * shape.size_multiplier[1] / max_mult
-        
-        center_x = size / 2
-        center_y = size / 2
-        
-        painter.setPen(QPen(QColor(100, 255, 100), 3))
-        painter.setBrush(QBrush(QColor(100, 255, 100, 60)))
-        
-        # Draw different shapes based on type
-        if shape.shape_type == ShapeType.SQUARE or shape.shape_type == ShapeType.RECTANGLE:
-            # Rectangle
-            x = center_x - shape_width / 2
-            y = center_y - shape_height / 2
-            painter.drawRect(int(x), int(y), int(shape_width), int(shape_height))
-        
-        elif shape.shape_type == ShapeType.TRIANGLE:
-            # Triangle (pointing up)
-            polygon = QPolygonF([
-                QPointF(center_x, center_y - shape_height / 2),  # Top
-                QPointF(center_x - shape_width / 2, center_y + shape_height / 2),  # Bottom left
-                QPointF(center_x + shape_width / 2, center_y + shape_height / 2),  # Bottom right
-            ])
-            painter.drawPolygon(polygon)
-        
-        elif shape.shape_type == ShapeType.CIRCLE or shape.shape_type == ShapeType.OVAL:
-            # Circle/Oval
-            x = center_x - shape_width / 2
-            y = center_y - shape_height / 2
-            painter.drawEllipse(int(x), int(y), int(shape_width), int(shape_height))
-        
-        elif shape.shape_type == ShapeType.ELLIPSE:
-            # Ellipse (horizontal)
-            x = center_x - shape_width / 2
-            y = center_y - shape_height / 2
-            painter.drawEllipse(int(x), int(y), int(shape_width), int(shape_height))
-        
-        elif shape.shape_type == ShapeType.RHOMBUS:
-            # Diamond/Rhombus
-            polygon = QPolygonF([
-                QPointF(center_x, center_y - shape_height / 2),  # Top
-                QPointF(center_x + shape_width / 2, center_y),  # Right
-                QPointF(center_x, center_y + shape_height / 2),  # Bottom
-                QPointF(center_x - shape_width / 2, center_y),  # Left
-            ])
-            painter.drawPolygon(polygon)
-        
-        elif shape.shape_type == ShapeType.PARALLELOGRAM:
-            # Parallelogram (skewed rectangle)
-            offset = shape_width * 0.2
-            polygon = QPolygonF([
-                QPointF(center_x - shape_width / 2 + offset, center_y - shape_height / 2),
-                QPointF(center_x + shape_width / 2 + offset, center_y - shape_height / 2),
-                QPointF(center_x + shape_width / 2 - offset, center_y + shape_height / 2),
-                QPointF(center_x - shape_width / 2 - offset, center_y + shape_height / 2),
-            ])
-            painter.drawPolygon(polygon)
-        
-        elif shape.shape_type == ShapeType.TRAPEZOID:
-            # Trapezoid
-            top_width = shape_width * 0.6
-            polygon = QPolygonF([
-                QPointF(center_x - top_width / 2, center_y - shape_height / 2),
-                QPointF(center_x + top_width / 2, center_y - shape_height / 2),
-                QPointF(center_x + shape_width / 2, center_y + shape_height / 2),
-                QPointF(center_x - shape_width / 2, center_y + shape_height / 2),
-            ])
-            painter.drawPolygon(polygon)
-        
-        elif shape.shape_type == ShapeType.PENTAGON:
-            # Pentagon (5 sides)
-            polygon = QPolygonF()
-            radius = min(shape_width, shape_height) / 2
-            for i in range(5):
-                angle = math.radians(i * 72 - 90)  # Start from top
-                px = center_x + radius * math.cos(angle)
-                py = center_y + radius * math.sin(angle)
-                polygon.append(QPointF(px, py))
-            painter.drawPolygon(polygon)
-        
-        elif shape.shape_type == ShapeType.HEXAGON:
-            # Hexagon (6 sides)
-            polygon = QPolygonF()
-            radius = min(shape_width, shape_height) / 2
-            for i in range(6):
-                angle = math.radians(i * 60 - 90)
-                px = center_x + radius * math.cos(angle)
-                py = center_y + radius * math.sin(angle)
-                polygon.append(QPointF(px, py))
-            painter.drawPolygon(polygon)
-        
-        elif shape.shape_type == ShapeType.OCTAGON:
-            # Octagon (8 sides)
-            polygon = QPolygonF()
-            radius = min(shape_width, shape_height) / 2
-            for i in range(8):
-                angle = math.radians(i * 45 - 90)
-                px = center_x + radius * math.cos(angle)
-                py = center_y + radius * math.sin(angle)
-                polygon.append(QPointF(px, py))
-            painter.drawPolygon(polygon)
-        
-        elif shape.shape_type == ShapeType.CUSTOM:
-            # Custom shape from vertices
-            if shape.vertices and len(shape.vertices) >= 3:
-                polygon = QPolygonF()
-                for vx, vy in shape.vertices:
-                    px = margin + vx * (size - 2 * margin)
-                    py = margin + vy * (size - 2 * margin)
-                    polygon.append(QPointF(px, py))
-                painter.drawPolygon(polygon)
-            else:
-                # Fallback to rectangle
-                x = center_x - shape_width / 2
-                y = center_y - shape_height / 2
-                painter.drawRect(int(x), int(y), int(shape_width), int(shape_height))
-        
-        # Draw shape name
-        painter.setPen(QPen(QColor(255, 255, 255), 1))
-        painter.setFont(QFont("Arial", 10, QFont.Weight.Bold))
-        painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignBottom | Qt.AlignmentFlag.AlignHCenter, shape.name)
-        
-        painter.end()
-        
-        label.setPixmap(pixmap.scaled(180, 70, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
-        label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        
-        return label
-    
-    
     def on_save(self):
         """Save configuration."""
         # Shapes are already updated in real-time by ShapeWidget clicks
@@ -496,9 +435,10 @@ class ShapeManagerDialog(QDialog):
     
     def on_add_custom(self):
         """Add a custom shape."""
-        from gui.custom_shape_editor import CustomShapeEditor
-        
-        dialog = CustomShapeEditor(self)
+        if self._editor is None:
+            self._editor = CustomShapeEditor(self)
+        dialog = self._editor
+        dialog.reset()
         if dialog.exec() == QDialog.DialogCode.Accepted:
             name, vertices = dialog.get_shape()
             
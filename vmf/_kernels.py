@@ -0,0 +1,46 @@
+"""Numeric kernels for brush geometry (compiled with Numba when installed)."""
+
+from typing import Tuple
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; fall back to NumPy
+    njit = None
+
+
+def _rotate_xy_numpy(
+    xs: np.ndarray, ys: np.ndarray,
+    center_x: np.ndarray, center_y: np.ndarray,
+    cos_a: np.ndarray, sin_a: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Rotate points around per-point centers in the XY plane.
+    
+    Elementwise (no matmul) so results match scalar float math exactly.
+    """
+    # Translate to origin
+    dx = xs - center_x
+    dy = ys - center_y
+    
+    # Rotate, then translate back
+    return dx * cos_a - dy * sin_a + center_x, dx * sin_a + dy * cos_a + center_y
+
+
+if njit is not None:
+    # No fastmath: contracting to FMA would change the written coordinates.
+    # Serial: a map's corners are too few for threads to pay off.
+    @njit(cache=True)
+    def _rotate_xy_numba(xs, ys, center_x, center_y, cos_a, sin_a):
+        new_xs = np.empty_like(xs)
+        new_ys = np.empty_like(ys)
+        for i in range(xs.shape[0]):
+            dx = xs[i] - center_x[i]
+            dy = ys[i] - center_y[i]
+            new_xs[i] = dx * cos_a[i] - dy * sin_a[i] + center_x[i]
+            new_ys[i] = dx * sin_a[i] + dy * cos_a[i] + center_y[i]
+        return new_xs, new_ys
+
+    rotate_xy = _rotate_xy_numba
+else:
+    rotate_xy = _rotate_xy_numpy
@@ -1,74 +1,298 @@
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 import math
+from functools import lru_cache
+from operator import attrgetter, itemgetter
+import numpy as np
+from vmf._kernels import rotate_xy
+
+
+def _fmt(value: float) -> str:
+    """Formats a coordinate, writing integer-valued floats without '.0'."""
+    # Normalize first: NumPy scalars repr as "np.float64(0.5)"
+    value = float(value)
+    if value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+def _vertex_field(name: str) -> property:
+    """
+    Vertex coordinate stored in a "_" slot; setting it drops the cached
+    strings and the owning solid's cached VMF text and box fast path.
+    """
+    slot = "_" + name
+
+    def set_field(self, value):
+        setattr(self, slot, value)
+        self._invalidate()
+
+    return property(attrgetter(slot), set_field)
 
 
 class Vertex:
     """3D point in space."""
 
+    __slots__ = (
+        "_x", "_y", "_z", "_plane_str", "_vertex_str",
+        "_solid",  # Owning Solid, whose cached text depends on this vertex
+    )
+
+    x = _vertex_field("x")
+    y = _vertex_field("y")
+    z = _vertex_field("z")
+
     def __init__(self, x: float, y: float, z: float):
-        self.x = x
-        self.y = y
-        self.z = z
+        self._x = x
+        self._y = y
+        self._z = z
+        # Formatted coordinates, built on first use (shared corners are
+        # written by up to 6 sides)
+        self._plane_str = None
+        self._vertex_str = None
+        self._solid = None
+
+    def _invalidate(self):
+        """Drops text cached from this vertex's coordinates."""
+        self._plane_str = None
+        self._vertex_str = None
+        solid = self._solid
+        if solid is not None:
+            solid._vmf_cache = None
+            solid._box_geometry = False
+
+    def move_xy(self, x: float, y: float):
+        """Moves the vertex in the XY plane, dropping cached strings."""
+        self._x = x
+        self._y = y
+        self._invalidate()
 
     def __str__(self) -> str:
         # For plane, we need parentheses, for vertices_plus, we don't
-        return f"({self.x} {self.y} {self.z})"
+        if self._plane_str is None:
+            self._plane_str = f"({self.to_vertex_string()})"
+        return self._plane_str
+
+    # Debug output shows the same cached "(x y z)" form
+    __repr__ = __str__
 
     def to_vertex_string(self) -> str:
         """Returns coordinates WITHOUT parentheses for vertices_plus."""
-        return f"{self.x} {self.y} {self.z}"
+        if self._vertex_str is None:
+            self._vertex_str = f"{_fmt(self._x)} {_fmt(self._y)} {_fmt(self._z)}"
+        return self._vertex_str
+
+
+# Texture axes and material shared by every box side (one string object each)
+_AXIS_X = "[1 0 0 0] 0.25"
+_AXIS_Y = "[0 1 0 0] 0.25"
+_AXIS_NEG_Y = "[0 -1 0 0] 0.25"
+_AXIS_NEG_Z = "[0 0 -1 0] 0.25"
+_BOX_MATERIAL = "DEV/DEV_MEASUREGENERIC01B"
+
+# Serialization templates (%-formatted; braces are literal)
+_VERTEX_SEPARATOR = '"\n\t\t\t"v" "'  # Joins vertices_plus coordinates
+# A side is _SIDE_HEAD, its id, then _SIDE_TEMPLATE; the id is kept apart
+# so the writer can number sides without touching the rest
+_SIDE_HEAD = '\tside\n\t{\n\t\t"id" "'
+_SIDE_TEMPLATE = """"
+		"plane" "%s %s %s"
+		vertices_plus
+		{
+			"v" "%s"
+		}
+		"material" "%s"
+		"uaxis" "%s"
+		"vaxis" "%s"
+		"rotation" "%s"
+		"lightmapscale" "%s"
+		"smoothing_groups" "%s"
+	}"""
+
+_SOLID_HEADER_TEMPLATE = 'solid\n{\n\t"id" "%s"'
+
+_SOLID_FOOTER = """	editor
+	{
+		"color" "0 180 0"
+		"visgroupshown" "1"
+		"visgroupautoshown" "1"
+	}
+}"""
+
+
+@lru_cache(maxsize=None)
+def _templates(indent: str) -> Tuple[str, str, str, str, str]:
+    """
+    (side head, side template, vertex separator, solid header, solid footer)
+    with every line prefixed by indent, so nested output needs no re-indent
+    pass.
+    """
+    def with_indent(text: str) -> str:
+        return indent + text.replace("\n", "\n" + indent)
+
+    return (
+        with_indent(_SIDE_HEAD),
+        _SIDE_TEMPLATE.replace("\n", "\n" + indent),
+        _VERTEX_SEPARATOR.replace("\n", "\n" + indent),
+        with_indent(_SOLID_HEADER_TEMPLATE),
+        with_indent(_SOLID_FOOTER),
+    )
+
+
+def _side_field(name: str, geometry: bool = False) -> property:
+    """
+    Side attribute stored in a "_" slot; setting it drops the owning
+    solid's cached VMF text (and, for geometry, its box fast path).
+    """
+    slot = "_" + name
+
+    def set_field(self, value):
+        setattr(self, slot, value)
+        solid = self._solid
+        if solid is not None:
+            solid._vmf_cache = None
+            if geometry:
+                solid._box_geometry = False
+                for vertex in value:
+                    vertex._solid = solid
+
+    return property(attrgetter(slot), set_field)
 
 
 class Side:
     """Side of a brush (face)."""
 
+    # Six per brush; no per-instance __dict__
+    __slots__ = (
+        "id", "_plane", "_vertices", "_material", "_uaxis", "_vaxis",
+        "_rotation", "_lightmapscale", "_smoothing_groups",
+        "_solid",  # Owning Solid, whose cached text depends on this side
+    )
+
+    plane = _side_field("plane", geometry=True)
+    vertices = _side_field("vertices", geometry=True)
+    material = _side_field("material")
+    uaxis = _side_field("uaxis")
+    vaxis = _side_field("vaxis")
+    rotation = _side_field("rotation")
+    lightmapscale = _side_field("lightmapscale")
+    smoothing_groups = _side_field("smoothing_groups")
+
     def __init__(
         self,
         id: int,
         plane: List[Vertex],
         material: str = "TOOLS/TOOLSNODRAW",
         vertices: List[Vertex] = None,
-        uaxis: str = None,
-        vaxis: str = None,
+        uaxis: str = _AXIS_X,
+        vaxis: str = _AXIS_NEG_Y,
     ):
         self.id = id
-        self.plane = plane  # 3 points, defining the plane
-        self.vertices = (
+        self._plane = plane  # 3 points, defining the plane
+        self._vertices = (
             vertices if vertices else plane
         )  # All vertices of the face (usually 4)
-        self.material = material
-        self.uaxis = uaxis if uaxis else "[1 0 0 0] 0.25"
-        self.vaxis = vaxis if vaxis else "[0 -1 0 0] 0.25"
-        self.rotation = 0
-        self.lightmapscale = 16
-        self.smoothing_groups = 0
-
-    def to_vmf(self) -> str:
-        """Converts side to VMF format."""
-        # Form vertices_plus section (WITHOUT parentheses!)
-        vertices_vmf = "\n".join(
-            f'\t\t\t"v" "{v.to_vertex_string()}"' for v in self.vertices
+        self._material = material
+        # None (or empty) falls back to the default axes, like vertices
+        self._uaxis = uaxis if uaxis else _AXIS_X
+        self._vaxis = vaxis if vaxis else _AXIS_NEG_Y
+        self._rotation = 0
+        self._lightmapscale = 16
+        self._smoothing_groups = 0
+        self._solid = None
+
+    def to_vmf(self, indent: str = "") -> str:
+        """Converts side to VMF format, each line prefixed by indent."""
+        return _templates(indent)[0] + str(self.id) + self._body_vmf(indent)
+
+    def _body_vmf(self, indent: str) -> str:
+        """VMF text of the side after its id."""
+        _, side_template, vertex_separator, _, _ = _templates(indent)
+
+        # Form vertices_plus section (WITHOUT parentheses!) in a single join.
+        # Shared corners are usually formatted already: read the cached
+        # strings directly and only call into Vertex to fill them.
+        vertices_vmf = vertex_separator.join([
+            v._vertex_str or v.to_vertex_string() for v in self._vertices
+        ])
+
+        p0, p1, p2 = self._plane
+        return side_template % (
+            p0._plane_str or str(p0),
+            p1._plane_str or str(p1),
+            p2._plane_str or str(p2),
+            vertices_vmf,
+            self._material,
+            self._uaxis,
+            self._vaxis,
+            self._rotation,
+            self._lightmapscale,
+            self._smoothing_groups,
         )
 
-        return f"""	side
-	{{
-		"id" "{self.id}"
-		"plane" "{self.plane[0]} {self.plane[1]} {self.plane[2]}"
-		vertices_plus
-		{{
-{vertices_vmf}
-		}}
-		"material" "{self.material}"
-		"uaxis" "{self.uaxis}"
-		"vaxis" "{self.vaxis}"
-		"rotation" "{self.rotation}"
-		"lightmapscale" "{self.lightmapscale}"
-		"smoothing_groups" "{self.smoothing_groups}"
-	}}"""
+
+@lru_cache(maxsize=256)
+def _trig(rotation_z: float) -> Tuple[float, float]:
+    """(cos, sin) of a Z rotation in degrees; maps reuse a few angles."""
+    angle_rad = math.radians(rotation_z)
+    return math.cos(angle_rad), math.sin(angle_rad)
+
+
+def box_bounds(
+    pos: Tuple[float, float, float],
+    size: Tuple[float, float, float],
+    rotation_z: float = 0.0,
+) -> Tuple[float, float, float, float]:
+    """
+    XY bounding box (min_x, min_y, max_x, max_y) of a box brush, without
+    building its Vertex/Side objects.
+    
+    Matches Solid(..., pos, size, rotation_z).get_rotated_bounds().
+    """
+    x, y, _ = pos
+    w, l, _ = size
+    if rotation_z == 0:
+        return (x, y, x + w, y + l)
+    
+    cos_a, sin_a = _trig(rotation_z)
+    center_x = x + w / 2
+    center_y = y + l / 2
+    
+    # Rotate the 4 footprint corners with the same arithmetic as rotate_xy,
+    # tracking the extents as we go
+    min_x = min_y = math.inf
+    max_x = max_y = -math.inf
+    for cx, cy in ((x, y + l), (x + w, y + l), (x + w, y), (x, y)):
+        dx = cx - center_x
+        dy = cy - center_y
+        rx = dx * cos_a - dy * sin_a + center_x
+        ry = dx * sin_a + dy * cos_a + center_y
+        if rx < min_x:
+            min_x = rx
+        if rx > max_x:
+            max_x = rx
+        if ry < min_y:
+            min_y = ry
+        if ry > max_y:
+            max_y = ry
+    
+    return (min_x, min_y, max_x, max_y)
+
+
+# Whether each box corner (Solid.corners order) sits at the max X / Y / Z
+_CORNER_X_MAX = (0, 1, 1, 0, 0, 1, 1, 0)
+_CORNER_Y_MAX = (0, 0, 1, 1, 0, 0, 1, 1)
+_CORNER_Z_MAX = (0, 0, 0, 0, 1, 1, 1, 1)
 
 
 class Solid:
-    """Brush (solid block)."""
+    """
+    Brush (solid block).
+    
+    Z rotation is applied lazily: the writer rotates all solids in one
+    batch with apply_pending_rotations(). Reading sides or corners
+    resolves a solid's pending rotation first, so they always hold the
+    rotated vertices.
+    """
 
     def __init__(
         self,
@@ -90,12 +314,24 @@ class Solid:
         self.pos = pos
         self.size = size
         self.rotation_z = rotation_z
-        self.sides: List[Side] = []
+        self._sides: List[Side] = []
+        self._corners: Tuple[Vertex, ...] = ()  # Unique vertices shared by the sides
         self._create_box()
         
-        # Apply rotation if needed
-        if self.rotation_z != 0:
-            self._rotate_z(self.rotation_z)
+        # Rotation is applied lazily, batched across solids by
+        # apply_pending_rotations() (the writer does this before saving)
+        self._rotation_pending = self.rotation_z != 0
+        # The pos and size the corners were built from; a pending rotation
+        # works from these even if pos or size are reassigned meanwhile
+        self._built_from = (self.pos, self.size)
+        
+        # Unrotated box with the sides _create_box made: serialized from
+        # the whole-box template (see _box_template)
+        self._box_geometry = self.rotation_z == 0
+        
+        # (solid id, indent, side ids, text) of the last to_vmf() call;
+        # repeat saves with the same numbering reuse it
+        self._vmf_cache: Optional[Tuple[int, str, Tuple, str]] = None
 
     def _create_box(self):
         """Creates a standard box brush."""
@@ -106,212 +342,260 @@ class Solid:
         x_min, y_min, z_min = x, y, z
         x_max, y_max, z_max = x + w, y + l, z + h
 
+        # 8 corners shared by all sides: (b)ottom/(t)op, (s)outh/(n)orth, (w)est/(e)ast
+        bsw = Vertex(x_min, y_min, z_min)
+        bse = Vertex(x_max, y_min, z_min)
+        bne = Vertex(x_max, y_max, z_min)
+        bnw = Vertex(x_min, y_max, z_min)
+        tsw = Vertex(x_min, y_min, z_max)
+        tse = Vertex(x_max, y_min, z_max)
+        tne = Vertex(x_max, y_max, z_max)
+        tnw = Vertex(x_min, y_max, z_max)
+        self._corners = (bsw, bse, bne, bnw, tsw, tse, tne, tnw)
+        for corner in self._corners:
+            corner._solid = self
+
         side_id = self.id * 10
 
         # 6 sides of the cube - vertices MUST be counter-clockwise from outside!
-        # Top (players walk on this side) - Z max, looking from above
-        self.sides.append(
-            Side(
-                side_id + 1,
-                [
-                    Vertex(x_min, y_max, z_max),
-                    Vertex(x_max, y_max, z_max),
-                    Vertex(x_max, y_min, z_max),
-                ],
-                "DEV/DEV_MEASUREGENERIC01B",
-                [
-                    Vertex(x_min, y_max, z_max),
-                    Vertex(x_max, y_max, z_max),
-                    Vertex(x_max, y_min, z_max),
-                    Vertex(x_min, y_min, z_max),
-                ],
-                "[1 0 0 0] 0.25",
-                "[0 -1 0 0] 0.25",
-            )
-        )
+        # Built as one list literal: most maps are thousands of these boxes
+        self._sides = [
+            # Top (players walk on this side) - Z max, looking from above
+            Side(side_id + 1, [tnw, tne, tse], _BOX_MATERIAL,
+                 [tnw, tne, tse, tsw], _AXIS_X, _AXIS_NEG_Y),
+            # Bottom - Z min, looking from below
+            Side(side_id + 2, [bsw, bse, bne], _BOX_MATERIAL,
+                 [bsw, bse, bne, bnw], _AXIS_X, _AXIS_NEG_Y),
+            # West (-X), looking from outside (west side)
+            Side(side_id + 3, [tnw, tsw, bsw], _BOX_MATERIAL,
+                 [tnw, tsw, bsw, bnw], _AXIS_Y, _AXIS_NEG_Z),
+            # East (+X), looking from outside (east side)
+            Side(side_id + 4, [bne, bse, tse], _BOX_MATERIAL,
+                 [bne, bse, tse, tne], _AXIS_Y, _AXIS_NEG_Z),
+            # North (+Y), looking from outside (north side)
+            Side(side_id + 5, [tne, tnw, bnw], _BOX_MATERIAL,
+                 [tne, tnw, bnw, bne], _AXIS_X, _AXIS_NEG_Z),
+            # South (-Y), looking from outside (south side)
+            Side(side_id + 6, [bse, bsw, tsw], _BOX_MATERIAL,
+                 [bse, bsw, tsw, tse], _AXIS_X, _AXIS_NEG_Z),
+        ]
+        for side in self._sides:
+            side._solid = self
 
-        # Bottom - Z min, looking from below
-        self.sides.append(
-            Side(
-                side_id + 2,
-                [
-                    Vertex(x_min, y_min, z_min),
-                    Vertex(x_max, y_min, z_min),
-                    Vertex(x_max, y_max, z_min),
-                ],
-                "DEV/DEV_MEASUREGENERIC01B",
-                [
-                    Vertex(x_min, y_min, z_min),
-                    Vertex(x_max, y_min, z_min),
-                    Vertex(x_max, y_max, z_min),
-                    Vertex(x_min, y_max, z_min),
-                ],
-                "[1 0 0 0] 0.25",
-                "[0 -1 0 0] 0.25",
-            )
-        )
+    @property
+    def sides(self) -> List[Side]:
+        """Sides of the brush, with any pending rotation applied."""
+        if self._rotation_pending:
+            apply_pending_rotations([self])
+        return self._sides
 
-        # West (-X), looking from outside (west side)
-        self.sides.append(
-            Side(
-                side_id + 3,
-                [
-                    Vertex(x_min, y_max, z_max),
-                    Vertex(x_min, y_min, z_max),
-                    Vertex(x_min, y_min, z_min),
-                ],
-                "DEV/DEV_MEASUREGENERIC01B",
-                [
-                    Vertex(x_min, y_max, z_max),
-                    Vertex(x_min, y_min, z_max),
-                    Vertex(x_min, y_min, z_min),
-                    Vertex(x_min, y_max, z_min),
-                ],
-                "[0 1 0 0] 0.25",
-                "[0 0 -1 0] 0.25",
-            )
-        )
+    @sides.setter
+    def sides(self, sides: List[Side]):
+        for side in sides:
+            side._solid = self
+            for vertex in side._plane + side._vertices:
+                vertex._solid = self
+        self._sides = sides
+        self._vmf_cache = None
+        self._box_geometry = False
 
-        # East (+X), looking from outside (east side)
-        self.sides.append(
-            Side(
-                side_id + 4,
-                [
-                    Vertex(x_max, y_max, z_min),
-                    Vertex(x_max, y_min, z_min),
-                    Vertex(x_max, y_min, z_max),
-                ],
-                "DEV/DEV_MEASUREGENERIC01B",
-                [
-                    Vertex(x_max, y_max, z_min),
-                    Vertex(x_max, y_min, z_min),
-                    Vertex(x_max, y_min, z_max),
-                    Vertex(x_max, y_max, z_max),
-                ],
-                "[0 1 0 0] 0.25",
-                "[0 0 -1 0] 0.25",
-            )
-        )
-
-        # North (+Y), looking from outside (north side)
-        self.sides.append(
-            Side(
-                side_id + 5,
-                [
-                    Vertex(x_max, y_max, z_max),
-                    Vertex(x_min, y_max, z_max),
-                    Vertex(x_min, y_max, z_min),
-                ],
-                "DEV/DEV_MEASUREGENERIC01B",
-                [
-                    Vertex(x_max, y_max, z_max),
-                    Vertex(x_min, y_max, z_max),
-                    Vertex(x_min, y_max, z_min),
-                    Vertex(x_max, y_max, z_min),
-                ],
-                "[1 0 0 0] 0.25",
-                "[0 0 -1 0] 0.25",
-            )
-        )
+    @property
+    def corners(self) -> Tuple[Vertex, ...]:
+        """Unique box corners shared by the sides, with any pending rotation applied."""
+        if self._rotation_pending:
+            apply_pending_rotations([self])
+        return self._corners
 
-        # South (-Y), looking from outside (south side)
-        self.sides.append(
-            Side(
-                side_id + 6,
-                [
-                    Vertex(x_max, y_min, z_min),
-                    Vertex(x_min, y_min, z_min),
-                    Vertex(x_min, y_min, z_max),
-                ],
-                "DEV/DEV_MEASUREGENERIC01B",
-                [
-                    Vertex(x_max, y_min, z_min),
-                    Vertex(x_min, y_min, z_min),
-                    Vertex(x_min, y_min, z_max),
-                    Vertex(x_max, y_min, z_max),
-                ],
-                "[1 0 0 0] 0.25",
-                "[0 0 -1 0] 0.25",
-            )
-        )
-
-    def _rotate_z(self, angle_degrees: float):
-        """
-        Rotate all vertices around Z axis (top-down rotation).
-        Rotates around the center of the block.
-        
-        Args:
-            angle_degrees: Rotation angle in degrees
-        """
-        # Convert to radians
-        angle_rad = math.radians(angle_degrees)
-        cos_a = math.cos(angle_rad)
-        sin_a = math.sin(angle_rad)
-        
-        # Calculate center of the block (before rotation)
-        x, y, z = self.pos
-        w, l, h = self.size
-        center_x = x + w / 2
-        center_y = y + l / 2
-        
-        # Rotate all vertices in all sides
-        for side in self.sides:
-            # Rotate plane vertices
-            for vertex in side.plane:
-                self._rotate_vertex(vertex, center_x, center_y, cos_a, sin_a)
-            
-            # Rotate all vertices (for vertices_plus)
-            if side.vertices:
-                for vertex in side.vertices:
-                    self._rotate_vertex(vertex, center_x, center_y, cos_a, sin_a)
-    
-    def _rotate_vertex(
-        self, vertex: Vertex, center_x: float, center_y: float,
-        cos_a: float, sin_a: float
-    ):
-        """Rotate a single vertex around center point."""
-        # Translate to origin
-        dx = vertex.x - center_x
-        dy = vertex.y - center_y
-        
-        # Rotate
-        new_x = dx * cos_a - dy * sin_a
-        new_y = dx * sin_a + dy * cos_a
-        
-        # Translate back
-        vertex.x = new_x + center_x
-        vertex.y = new_y + center_y
-    
     def get_rotated_bounds(self) -> Tuple[float, float, float, float]:
         """
         Get axis-aligned bounding box (AABB) of the rotated block.
         Returns (min_x, min_y, max_x, max_y) for collision detection.
         """
-        if not self.sides or not self.sides[0].vertices:
+        if self._rotation_pending:
+            # Same result as rotating the corners, without doing it yet
+            pos, size = self._built_from
+            return box_bounds(pos, size, self.rotation_z)
+        
+        if not self._sides or not self._sides[0].vertices:
             # Fallback to original bounds
             x, y, _ = self.pos
             w, l, _ = self.size
             return (x, y, x + w, y + l)
         
         # Get all vertices from first side (top) which has all corners
-        vertices = self.sides[0].vertices
+        vertices = self._sides[0].vertices
         
-        x_coords = [v.x for v in vertices]
-        y_coords = [v.y for v in vertices]
+        first = vertices[0]
+        min_x = max_x = first._x
+        min_y = max_y = first._y
+        for v in vertices:
+            vx = v._x
+            vy = v._y
+            if vx < min_x:
+                min_x = vx
+            elif vx > max_x:
+                max_x = vx
+            if vy < min_y:
+                min_y = vy
+            elif vy > max_y:
+                max_y = vy
         
-        return (min(x_coords), min(y_coords), max(x_coords), max(y_coords))
-
-    def to_vmf(self) -> str:
-        """Converts solid to VMF format."""
-        sides_vmf = "\n".join(side.to_vmf() for side in self.sides)
-        return f"""solid
-{{
-	"id" "{self.id}"
-{sides_vmf}
-	editor
-	{{
-		"color" "0 180 0"
-		"visgroupshown" "1"
-		"visgroupautoshown" "1"
-	}}
-}}"""
+        return (min_x, min_y, max_x, max_y)
+
+    def to_vmf(self, indent: str = "", first_side_id: Optional[int] = None) -> str:
+        """
+        Converts solid to VMF format, each line prefixed by indent.
+        
+        Sides are numbered from first_side_id when given (the writer numbers
+        all sides of a map in sequence), otherwise their own ids are used.
+        
+        The result is cached; setting a side or vertex attribute or
+        replacing the sides drops the cache. Vertex lists edited in place
+        are not tracked.
+        """
+        sides = self._sides
+        if first_side_id is None:
+            side_ids = tuple([side.id for side in sides])
+        else:
+            side_ids = tuple(range(first_side_id, first_side_id + len(sides)))
+        
+        cache = self._vmf_cache
+        if (
+            cache is not None
+            and cache[0] == self.id
+            and cache[1] == indent
+            and cache[2] == side_ids
+        ):
+            return cache[3]
+        
+        if self._box_geometry:
+            # Unrotated box: one % over a whole-solid template, with its
+            # 6 distinct coordinates formatted once each
+            low = self._corners[0]
+            high = self._corners[6]
+            coords = (
+                _fmt(low._x), _fmt(high._x),
+                _fmt(low._y), _fmt(high._y),
+                _fmt(low._z), _fmt(high._z),
+            )
+            values = [self.id]
+            for side, side_id, pick in zip(sides, side_ids, _BOX_FACE_COORDS):
+                values.append(side_id)
+                values.extend(pick(coords))
+                values.extend((
+                    side._material, side._uaxis, side._vaxis,
+                    side._rotation, side._lightmapscale,
+                    side._smoothing_groups,
+                ))
+            text = _box_template(indent) % tuple(values)
+        else:
+            if self._rotation_pending:
+                apply_pending_rotations([self])
+            side_head, _, _, header_template, footer = _templates(indent)
+            parts = [header_template % self.id]
+            parts.extend([
+                side_head + str(side_id) + side._body_vmf(indent)
+                for side, side_id in zip(sides, side_ids)
+            ])
+            parts.append(footer)
+            text = "\n".join(parts)
+        
+        self._vmf_cache = (self.id, indent, side_ids, text)
+        return text
+
+
+# Corners (Solid.corners indices) of each box side in _create_box order:
+# (plane corners, polygon corners)
+_BOX_FACE_CORNERS = (
+    ((7, 6, 5), (7, 6, 5, 4)),  # Top
+    ((0, 1, 2), (0, 1, 2, 3)),  # Bottom
+    ((7, 4, 0), (7, 4, 0, 3)),  # West
+    ((2, 1, 5), (2, 1, 5, 6)),  # East
+    ((6, 7, 3), (6, 7, 3, 2)),  # North
+    ((1, 0, 4), (1, 0, 4, 5)),  # South
+)
+
+# Per side, picks its plane and polygon coordinates from a box's
+# (x_min, x_max, y_min, y_max, z_min, z_max) strings
+_BOX_FACE_COORDS = tuple(
+    itemgetter(*[
+        index
+        for corner in plane + polygon
+        for index in (
+            _CORNER_X_MAX[corner],
+            2 + _CORNER_Y_MAX[corner],
+            4 + _CORNER_Z_MAX[corner],
+        )
+    ])
+    for plane, polygon in _BOX_FACE_CORNERS
+)
+
+
+@lru_cache(maxsize=None)
+def _box_template(indent: str) -> str:
+    """
+    Whole-solid template for an unrotated box, every line prefixed by indent.
+    
+    Takes the solid id, then for each side: its id, 9 plane and 12 polygon
+    coordinates, material, uaxis, vaxis, rotation, lightmapscale and
+    smoothing_groups.
+    """
+    side_head, side_template, vertex_separator, header_template, footer = (
+        _templates(indent)
+    )
+    side = side_head + "%s" + side_template % (
+        "(%s %s %s)", "(%s %s %s)", "(%s %s %s)",
+        vertex_separator.join(["%s %s %s"] * 4),
+        "%s", "%s", "%s", "%s", "%s", "%s",
+    )
+    return "\n".join([header_template] + [side] * len(_BOX_FACE_CORNERS) + [footer])
+
+
+def apply_pending_rotations(solids: List[Solid]):
+    """
+    Rotate the corners of every solid whose Z rotation is still pending,
+    in one vectorized pass over all of their vertices.
+    
+    Each solid rotates around its own (unrotated) center.
+    """
+    pending = [solid for solid in solids if solid._rotation_pending]
+    if not pending:
+        return
+    
+    # Unrotated corners are fully determined by the pos and size they were
+    # built from, so build them as contiguous per-axis arrays (one row per
+    # solid, columns in Solid.corners order) instead of gathering from the
+    # Vertex objects
+    pos = np.array([solid._built_from[0] for solid in pending], dtype=np.float64)
+    size = np.array([solid._built_from[1] for solid in pending], dtype=np.float64)
+    x_min = pos[:, 0]
+    y_min = pos[:, 1]
+    w = size[:, 0]
+    l = size[:, 1]
+    xs = np.stack((x_min, x_min + w), axis=1)[:, _CORNER_X_MAX].ravel()
+    ys = np.stack((y_min, y_min + l), axis=1)[:, _CORNER_Y_MAX].ravel()
+    
+    # Per-solid center and angle, repeated for each of its corners
+    center_x = x_min + w / 2
+    center_y = y_min + l / 2
+    trig = np.array([_trig(solid.rotation_z) for solid in pending])
+    cos_a = trig[:, 0]
+    sin_a = trig[:, 1]
+    count = len(_CORNER_X_MAX)
+    
+    new_xs, new_ys = rotate_xy(
+        xs, ys,
+        np.repeat(center_x, count), np.repeat(center_y, count),
+        np.repeat(cos_a, count), np.repeat(sin_a, count),
+    )
+    corners = [vertex for solid in pending for vertex in solid._corners]
+    # Write the slots directly; the solids' caches are dropped below
+    for vertex, new_x, new_y in zip(corners, new_xs.tolist(), new_ys.tolist()):
+        vertex._x = new_x
+        vertex._y = new_y
+        vertex._plane_str = None
+        vertex._vertex_str = None
+    
+    for solid in pending:
+        solid._rotation_pending = False
+        solid._vmf_cache = None
@@ -1,65 +1,32 @@
-from typing import List
-from vmf.brushes import Solid
+import os
+import shutil
+import tempfile
+from typing import Iterator, List
+from vmf.brushes import Solid, apply_pending_rotations
 
 
-class VMFWriter:
-    """Class for writing VMF files."""
-
-    def __init__(self):
-        self.solids: List[Solid] = []
-        self.version_info = 400
-        self.editor_version = 400
-        self.map_version = 1
-
-    def add_solid(self, solid: Solid):
-        """Adds solid (brush) to the map."""
-        self.solids.append(solid)
-
-    def clear(self):
-        """Clears all solids."""
-        self.solids = []
-
-    def save(self, filepath: str):
-        """Saves VMF file."""
-        vmf_content = self._generate_vmf()
-
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(vmf_content)
-
-    def _generate_vmf(self) -> str:
-        """Generates full VMF content."""
-        # Generate solids and add indentation (tab) to each line
-        solids_list = []
-        for solid in self.solids:
-            solid_text = solid.to_vmf()
-            # Add tab to each non-empty line
-            indented = "\n".join(
-                "\t" + line if line.strip() else line for line in solid_text.split("\n")
-            )
-            solids_list.append(indented)
-        solids_vmf = "\n".join(solids_list)
-
-        vmf = f"""versioninfo
-{{
-	"editorversion" "{self.editor_version}"
+# Everything up to the world's solids (%-formatted: editor and map version)
+_HEADER_TEMPLATE = """versioninfo
+{
+	"editorversion" "%s"
 	"editorbuild" "8456"
-	"mapversion" "{self.map_version}"
+	"mapversion" "%s"
 	"formatversion" "100"
 	"prefab" "0"
-}}
+}
 visgroups
-{{
-}}
+{
+}
 viewsettings
-{{
+{
 	"bSnapToGrid" "1"
 	"bShowGrid" "1"
 	"bShowLogicalGrid" "0"
 	"nGridSpacing" "64"
 	"bShow3DGrid" "0"
-}}
+}
 world
-{{
+{
 	"id" "1"
 	"mapversion" "1"
 	"classname" "worldspawn"
@@ -67,31 +34,130 @@ world
 	"maxpropscreenwidth" "-1"
 	"detailvbsp" "detail.vbsp"
 	"detailmaterial" "detail/detailsprites"
-{solids_vmf}
-}}
+"""
+
+# Everything after the world's solids (closing brace onwards)
+_FOOTER = """
+}
 entity
-{{
+{
 	"id" "2"
 	"classname" "info_player_start"
 	"angles" "0 90 0"
 	"origin" "0 0 64"
 	editor
-	{{
+	{
 		"color" "0 255 0"
 		"visgroupshown" "1"
 		"visgroupautoshown" "1"
 		"logicalpos" "[0 0]"
-	}}
-}}
+	}
+}
 cameras
-{{
+{
 	"activecamera" "-1"
-}}
+}
 cordon
-{{
+{
 	"mins" "(-1024 -1024 -1024)"
 	"maxs" "(1024 1024 1024)"
 	"active" "0"
-}}
+}
 """
-        return vmf
+
+
+def _encode(text: str) -> bytes:
+    """
+    Encodes VMF text for a binary-mode file, translating newlines the way
+    text mode would on this platform.
+    """
+    if os.linesep != "\n":
+        text = text.replace("\n", os.linesep)
+    return text.encode("utf-8")
+
+
+# Constant chunks, encoded once
+_FOOTER_BYTES = _encode(_FOOTER)
+_SOLID_SEPARATOR_BYTES = _encode("\n")
+
+
+def _new_file_mode() -> int:
+    """Mode open() gives a new file under the current umask."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+# Read once at import: os.umask() can only be queried by setting it, which
+# is not safe once saves run on worker threads
+_NEW_FILE_MODE = _new_file_mode()
+
+
+class VMFWriter:
+    """Class for writing VMF files."""
+
+    def __init__(self):
+        self.solids: List[Solid] = []
+        self.version_info = 400
+        self.editor_version = 400
+        self.map_version = 1
+
+    def add_solid(self, solid: Solid):
+        """Adds solid (brush) to the map."""
+        self.solids.append(solid)
+
+    def extend(self, solids: List[Solid]):
+        """Adds several solids (brushes) to the map at once."""
+        self.solids.extend(solids)
+
+    def clear(self):
+        """Clears all solids."""
+        self.solids = []
+
+    def save(self, filepath: str):
+        """Saves VMF file."""
+        # Stream solid by solid instead of building the whole map in memory.
+        # Binary mode skips the text layer; the constant chunks are encoded
+        # once at import and only the solids are encoded per save.
+        # Write to a temporary file next to the target and move it into
+        # place at the end, so a failed save never leaves a half-written map
+        directory = os.path.dirname(os.path.abspath(filepath))
+        fd, temp_path = tempfile.mkstemp(
+            prefix=os.path.basename(filepath) + ".", suffix=".tmp", dir=directory
+        )
+        try:
+            with os.fdopen(fd, "wb", buffering=1 << 20) as f:
+                write = f.write
+                write(_encode(self._header()))
+                for i, text in enumerate(self._iter_solid_texts()):
+                    if i:
+                        write(_SOLID_SEPARATOR_BYTES)
+                    write(_encode(text))
+                write(_FOOTER_BYTES)
+            # mkstemp() makes the file private to the user; give it the
+            # mode the map already has, or would get as a new file
+            if os.path.exists(filepath):
+                shutil.copymode(filepath, temp_path)
+            else:
+                os.chmod(temp_path, _NEW_FILE_MODE)
+            os.replace(temp_path, filepath)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def _iter_solid_texts(self) -> Iterator[str]:
+        """Yields the world solids' VMF text, in order."""
+        solids = self.solids
+        # Rotate all pending solids in one batch before serializing
+        apply_pending_rotations(solids)
+        # Side ids are numbered across the whole map, in write order
+        side_id = 1
+        for solid in solids:
+            # Solids sit inside world, one tab deep
+            yield solid.to_vmf("\t", side_id)
+            side_id += len(solid.sides)
+
+    def _header(self) -> str:
+        """VMF text up to the world's solids."""
+        return _HEADER_TEMPLATE % (self.editor_version, self.map_version)